@@ -4,6 +4,7 @@ from django.core.management.base import BaseCommand
 from django.db import transaction as db_transaction
 from django.utils import timezone
 from django.db.models import Sum, Count, Case, When, F, Q, DecimalField
+from django.db.models.functions import TruncDate
 
 from analytics.models import DailyAnalytics, ImpactMetrics, SystemMetrics
 from transactions.models import FoodRequest, Transaction
@@ -226,37 +227,41 @@ class Command(BaseCommand):
                     completion_date__date__gte=start_date
                 )
                 
-            dates = set()
+            # Only the distinct completion days are needed, not the rows
+            dates = set(
+                transaction_query.annotate(day=TruncDate("completion_date"))
+                .order_by()
+                .values_list("day", flat=True)
+                .distinct()
+            )
             
-            for transaction in transaction_query:
-                if transaction.completion_date:
-                    dates.add(transaction.completion_date.date())
-                    
             self.stdout.write(f"Found {len(dates)} unique dates with transactions")
             
-            # Calculate metrics for each date
+            # Calculate metrics for every active date with one grouped query
             created_count = 0
             updated_count = 0
             
-            for date in sorted(dates):
-                metrics, created = ImpactMetrics.objects.update_or_create(
-                    date=date,
-                    defaults={}
+            if dates:
+                existing_dates = set(
+                    ImpactMetrics.objects.filter(date__in=dates).values_list(
+                        "date", flat=True
+                    )
                 )
-                
-                # Recalculate metrics for the date
-                metrics = ImpactMetrics.calculate_for_date(date)
-                
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-                    
-                self.stdout.write(
-                    f"Updated impact metrics for {date}: {metrics.food_redistributed_kg}kg food, "
-                    f"{metrics.co2_emissions_saved}kg CO2, {metrics.meals_provided} meals"
+                all_metrics = ImpactMetrics.calculate_for_range(
+                    min(dates), max(dates), skip_empty=True
                 )
                 
+                for metrics in all_metrics:
+                    if metrics.date in existing_dates:
+                        updated_count += 1
+                    else:
+                        created_count += 1
+                        
+                    self.stdout.write(
+                        f"Updated impact metrics for {metrics.date}: {metrics.food_redistributed_kg}kg food, "
+                        f"{metrics.co2_emissions_saved}kg CO2, {metrics.meals_provided} meals"
+                    )
+                
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Successfully processed {created_count} new and {updated_count} updated impact metrics"
@@ -49,6 +49,15 @@ class Command(BaseCommand):
         
         self.stdout.write(f"Found {completed_txns} completed transactions in date range")
 
+        # A forced impact recalculation covers the whole range, so it is done
+        # up front with one grouped query instead of once per day
+        impact_by_date = {}
+        if force and metrics_type in ["all", "impact"]:
+            impact_by_date = {
+                metrics.date: metrics
+                for metrics in ImpactMetrics.calculate_for_range(start_date, end_date)
+            }
+
         # Calculate metrics for each date in the range
         current_date = start_date
         impact_count = 0
@@ -59,16 +68,20 @@ class Command(BaseCommand):
                 # Calculate impact metrics if requested
                 if metrics_type in ["all", "impact"]:
                     # Check if metrics exist for this date and respect force flag
-                    metrics_exist = ImpactMetrics.objects.filter(date=current_date).exists()
-                    if force or not metrics_exist:
+                    if current_date in impact_by_date:
+                        impact_metrics = impact_by_date[current_date]
+                    elif force or not ImpactMetrics.objects.filter(date=current_date).exists():
                         impact_metrics = ImpactMetrics.calculate_for_date(current_date)
+                    else:
+                        impact_metrics = None
+                        self.stdout.write(f"Skipping existing impact metrics for {current_date} (use --force to override)")
+
+                    if impact_metrics is not None:
                         self.stdout.write(
                             f"Impact metrics for {current_date}: {impact_metrics.food_redistributed_kg}kg food redistributed, "
                             f"{impact_metrics.co2_emissions_saved}kg CO2 saved, {impact_metrics.meals_provided} meals provided"
                         )
                         impact_count += 1
-                    else:
-                        self.stdout.write(f"Skipping existing impact metrics for {current_date} (use --force to override)")
 
                 # Calculate system metrics if requested
                 if metrics_type in ["all", "system"]:
@@ -0,0 +1,46 @@
+# Generated by Django 5.1.6 on 2026-10-16 12:05
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def fix_invalid_daily_analytics(apps, schema_editor):
+    DailyAnalytics = apps.get_model('analytics', 'DailyAnalytics')
+
+    # Clamp negative totals to zero
+    DailyAnalytics.objects.filter(requests_received__lt=0).update(requests_received=0)
+    DailyAnalytics.objects.filter(requests_fulfilled__lt=0).update(requests_fulfilled=0)
+    DailyAnalytics.objects.filter(food_saved_kg__lt=0).update(food_saved_kg=0)
+
+    # A fulfilled request was also received, so raise the received count
+    DailyAnalytics.objects.filter(requests_fulfilled__gt=F('requests_received')).update(
+        requests_received=F('requests_fulfilled')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0019_alter_systemmetrics_avg_response_time'),
+    ]
+
+    operations = [
+        # Fix rows that break the new constraints before adding them
+        migrations.RunPython(fix_invalid_daily_analytics, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='dailyanalytics',
+            constraint=models.CheckConstraint(condition=models.Q(('requests_received__gte', 0)), name='dailyanalytics_requests_received_gte_0'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyanalytics',
+            constraint=models.CheckConstraint(condition=models.Q(('requests_fulfilled__gte', 0)), name='dailyanalytics_requests_fulfilled_gte_0'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyanalytics',
+            constraint=models.CheckConstraint(condition=models.Q(('food_saved_kg__gte', 0)), name='dailyanalytics_food_saved_kg_gte_0'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyanalytics',
+            constraint=models.CheckConstraint(condition=models.Q(('requests_fulfilled__lte', models.F('requests_received'))), name='dailyanalytics_fulfilled_lte_received'),
+        ),
+    ]
@@ -1,13 +1,20 @@
-from datetime import datetime, timedelta, time
+import hashlib
+import json
+import logging
+import re
+from functools import lru_cache
+from datetime import date, datetime, timedelta, time
+from dataclasses import dataclass
 from decimal import Decimal
 from io import BytesIO
-from typing import Dict, Optional, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
-import xlsxwriter
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.db.models import (
     Avg,
     Count,
@@ -20,18 +27,422 @@ from django.db.models import (
     Value,
     Q,
 )
-from django.db.models.functions import Concat, TruncDay, Coalesce, ExtractWeekDay, ExtractHour
+from django.db.models.functions import Cast, Concat, TruncDay, Coalesce, ExtractWeekDay, ExtractHour, NullIf, TruncDate
 from django.db.utils import Error as DBError
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.utils import timezone
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from django.utils.functional import cached_property
 
 from food_listings.models import ComplianceCheck, FoodListing
 from transactions.models import DeliveryAssignment, FoodRequest, Transaction, Rating
 
+if TYPE_CHECKING:
+    import xlsxwriter
+
+logger = logging.getLogger(__name__)
+
+
+# Anything other than word characters, spaces and hyphens is dropped from export filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]+")
+
+
+# Shared Decimal constants for the metric calculations
+_DEC_ZERO = Decimal("0")
+_DEC_CENTS_ZERO = Decimal("0.00")
+_DEC_CO2 = Decimal("2.5")  # kg of CO2 saved per kg of food
+_DEC_MEALS = Decimal("2")  # meals provided per kg of food
+_DEC_DEFAULT_PRICE = Decimal("1.00")  # value per kg for listings without a price
+
+
+# Data keys every generated report of a given type must contain
+_REQUIRED_DATA_KEYS = MappingProxyType(
+    {
+        "IMPACT": ("summary", "daily_trends"),
+        "TRANSACTION": ("metrics", "status_breakdown"),
+        "USER_ACTIVITY": (
+            "total_activities",
+            "unique_users",
+            "activity_types",
+            "user_type_breakdown",
+        ),
+        "COMPLIANCE": (
+            "total_listings",
+            "total_checks",
+            "passed",
+            "failed",
+            "compliance_rate",
+        ),
+        "SYSTEM": ("summary", "daily_trends"),
+    }
+)
+
+
+# Day names indexed by ExtractWeekDay - 1 (the database numbers 1=Sunday .. 7=Saturday)
+_WEEKDAY_NAMES = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+
+
+def _day_bounds(day):
+    """Return the aware [start, end) datetimes covering a calendar day"""
+    day_start = timezone.make_aware(datetime.combine(day, time.min))
+    return day_start, day_start + timedelta(days=1)
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(date_str: str) -> date:
+    """Parse a YYYY-MM-DD trend date, memoised across export calls"""
+    return date.fromisoformat(date_str)
+
+
+def _format_kg(value) -> str:
+    """Format a weight in kg to one decimal place"""
+    return f"{float(value):.1f}"
+
+
+# Nested metric sections that exports render as their own tables rather than
+# as rows of the key metrics table, plus the extra ones for some report types
+_NESTED_METRIC_KEYS = frozenset(
+    {"top_suppliers", "food_categories", "rescued_by_category", "peak_rescue_times"}
+)
+_SKIP_KEYS_BY_TYPE = MappingProxyType(
+    {
+        "EXPIRY_WASTE": _NESTED_METRIC_KEYS
+        | {"suppliers_with_most_expired", "expired_by_food_type"},
+        "BENEFICIARY": _NESTED_METRIC_KEYS
+        | {"nutritional_value", "satisfaction_metrics", "food_by_beneficiary_type"},
+        "VOLUNTEER": _NESTED_METRIC_KEYS
+        | {"top_volunteers", "activity_by_day", "volunteer_reliability"},
+    }
+)
+
+
+class _Echo:
+    """File-like object whose write() returns the data, for streaming csv.writer output"""
+
+    def write(self, value):
+        return value
+
+
+@lru_cache(maxsize=4096)
+def _format_int(value: int) -> str:
+    """Format an integer with thousands separators, memoised as report values repeat a lot"""
+    return f"{value:,}"
+
+
+def _format_csv_float(value: float) -> str:
+    """Format a CSV metric float: whole numbers as integers, others to one decimal place"""
+    return _format_int(int(value)) if value.is_integer() else f"{value:.1f}"
+
+
+# Formatters for key metric values in the CSV export, looked up by exact type
+_CSV_METRIC_FORMATTERS = {
+    int: _format_int,
+    bool: _format_int,
+    float: _format_csv_float,
+}
+
+
+# Numbers in trend tables get thousands separators, floats two decimal places
+_TREND_VALUE_FORMATTERS = {
+    int: _format_int,
+    bool: _format_int,
+    float: "{:,.2f}".format,
+}
+
+
+def _format_trend_value(value) -> str:
+    """Format one daily trends cell for the PDF export"""
+    formatter = _TREND_VALUE_FORMATTERS.get(type(value))
+    return formatter(value) if formatter else str(value)
+
+
+@dataclass(frozen=True)
+class _TableSpec:
+    """A list under report metrics that the PDF and CSV exports show as its own table"""
+
+    title: str
+    metric_key: str
+    headers: tuple
+    fields: tuple  # (key, default, formatter) for each column
+    col_widths: tuple  # PDF column widths in points
+    style: str  # key into _pdf_table_styles()
+
+
+# Tables shown before the peak rescue times section, for every report type
+_LEADING_TABLES = (
+    _TableSpec(
+        "Top Suppliers",
+        "top_suppliers",
+        ("Supplier", "Transaction Count", "Total Food (kg)"),
+        (("supplier_name", "Unknown", str), ("transaction_count", 0, str), ("total_food_kg", 0, _format_kg)),
+        (200, 150, 150),
+        "breakdown",
+    ),
+    _TableSpec(
+        "Food Categories",
+        "food_categories",
+        ("Category", "Count", "Total (kg)"),
+        (("listing_type", "Unknown", str), ("count", 0, str), ("total_kg", 0, _format_kg)),
+        (200, 150, 150),
+        "breakdown",
+    ),
+    _TableSpec(
+        "Rescued By Category",
+        "rescued_by_category",
+        ("Category", "Count", "Total (kg)"),
+        (("category", "Unknown", str), ("count", 0, str), ("total_kg", 0, _format_kg)),
+        (200, 150, 150),
+        "breakdown",
+    ),
+)
+
+# Tables shown after the peak rescue times section, only for some report types
+_TRAILING_TABLES_BY_TYPE = MappingProxyType(
+    {
+        "EXPIRY_WASTE": (
+            _TableSpec(
+                "Suppliers With Most Expired Listings",
+                "suppliers_with_most_expired",
+                ("Supplier", "Expired Count", "Food Wasted (kg)"),
+                (("supplier_name", "", str), ("expired_count", 0, str), ("wasted_kg", 0, _format_kg)),
+                (200, 120, 120),
+                "expired_suppliers",
+            ),
+            _TableSpec(
+                "Expired Food By Type",
+                "expired_by_food_type",
+                ("Food Type", "Count", "Wasted (kg)"),
+                (("type", "", str), ("count", 0, str), ("wasted_kg", 0, _format_kg)),
+                (200, 120, 120),
+                "expired_types",
+            ),
+        ),
+    }
+)
+
+
+# Peak rescue table fields for _rows(); the PDF leaves a missing name blank
+# while the CSV writes "Unknown"
+_PEAK_DAY_PDF_FIELDS = (("day_name", "", str), ("count", 0, str))
+_PEAK_HOUR_PDF_FIELDS = (("formatted_hour", "", str), ("count", 0, str))
+_PEAK_DAY_CSV_FIELDS = (("day_name", "Unknown", str), ("count", 0, str))
+_PEAK_HOUR_CSV_FIELDS = (("formatted_hour", "Unknown", str), ("count", 0, str))
+
+
+def _rows(items, fields):
+    """Format the dict entries of a report sublist into table rows"""
+    return [
+        [fmt(item.get(key, default)) for key, default, fmt in fields]
+        for item in items
+        if isinstance(item, dict)
+    ]
+
+
+def _append_spec_tables(elements, metrics, specs):
+    """Append the PDF table for each spec whose list is present in metrics"""
+    table_styles = _pdf_table_styles()
+    for spec in specs:
+        items = metrics.get(spec.metric_key)
+        if isinstance(items, list):
+            _append_table(
+                elements,
+                spec.title,
+                list(spec.headers),
+                _rows(items, spec.fields),
+                list(spec.col_widths),
+                table_styles[spec.style],
+            )
+
+
+def _csv_spec_tables(metrics, specs):
+    """Yield the CSV rows for each spec whose list is present in metrics"""
+    for spec in specs:
+        items = metrics.get(spec.metric_key)
+        if isinstance(items, list):
+            yield [spec.title]
+            yield list(spec.headers)
+            yield from _rows(items, spec.fields)
+            yield []  # Empty row for spacing
+
+
+@lru_cache(maxsize=None)
+def _pdf_paragraph_styles():
+    """reportlab's sample stylesheet plus the report title, info and summary styles"""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    styles = getSampleStyleSheet()
+    # Enhanced title style
+    styles.add(
+        ParagraphStyle(
+            "CustomTitle",
+            parent=styles["Heading1"],
+            fontSize=24,
+            spaceAfter=30,
+            textColor=colors.HexColor("#2c3e50"),
+            alignment=1,  # Center alignment
+        )
+    )
+    # Enhanced info section style
+    styles.add(
+        ParagraphStyle(
+            "InfoStyle",
+            parent=styles["Normal"],
+            fontSize=10,
+            textColor=colors.HexColor("#34495e"),
+            spaceAfter=5,
+            bulletIndent=20,
+            leftIndent=20,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            "SummaryStyle",
+            parent=styles["Normal"],
+            fontSize=12,
+            textColor=colors.HexColor("#2c3e50"),
+            backColor=colors.HexColor("#ecf0f1"),
+            borderPadding=15,  # Increased padding
+            borderRadius=5,
+            spaceAfter=20,  # Add space after summary
+            spaceBefore=10,  # Add space before summary
+        )
+    )
+    return styles
+
+
+@lru_cache(maxsize=None)
+def _pdf_table_styles():
+    """TableStyles shared by every PDF export, built once on first use"""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    blue = colors.HexColor("#3498db")
+    dark = colors.HexColor("#2c3e50")
+    grid = colors.HexColor("#bdc3c7")
+    stripes = [colors.white, colors.HexColor("#f9f9f9")]
+
+    def headed_table(header_color):
+        return TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), header_color),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, 0), 11),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+                ("GRID", (0, 0), (-1, -1), 1, grid),
+                ("ROWBACKGROUNDS", (0, 1), (-1, -1), stripes),
+                ("ALIGN", (1, 1), (2, -1), "RIGHT"),
+            ]
+        )
+
+    return MappingProxyType(
+        {
+            "metrics": TableStyle(
+                [
+                    ("BACKGROUND", (0, 0), (-1, 0), blue),
+                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                    ("FONTSIZE", (0, 0), (-1, 0), 12),
+                    ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                    ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+                    ("TEXTCOLOR", (0, 1), (-1, -1), dark),
+                    ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+                    ("FONTSIZE", (0, 1), (-1, -1), 10),
+                    ("GRID", (0, 0), (-1, -1), 1, grid),
+                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), stripes),
+                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                    ("LEFTPADDING", (0, 0), (-1, -1), 15),
+                ]
+            ),
+            # Name / count / kg tables: top suppliers and the category breakdowns
+            "breakdown": headed_table(blue),
+            # Two-column rescue activity by day and by hour
+            "activity": TableStyle(
+                [
+                    ("BACKGROUND", (0, 0), (-1, 0), blue),
+                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                    ("ALIGN", (0, 0), (-1, 0), "LEFT"),
+                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                    ("FONTSIZE", (0, 0), (-1, 0), 10),
+                    ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
+                    ("TOPPADDING", (0, 0), (-1, 0), 8),
+                    ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+                    ("GRID", (0, 0), (-1, -1), 1, grid),
+                    ("ALIGN", (1, 1), (1, -1), "RIGHT"),
+                ]
+            ),
+            "expired_suppliers": headed_table(colors.HexColor("#e74c3c")),
+            "expired_types": headed_table(colors.HexColor("#e67e22")),
+        }
+    )
+
+
+def _append_table(
+    elements,
+    title,
+    headers,
+    rows,
+    col_widths,
+    style,
+    heading="Heading2",
+    space_before=10,
+    space_after=20,
+):
+    """Append a titled table to a PDF story; only the title is added when there are no rows"""
+    from reportlab.platypus import Paragraph, Spacer, Table
+
+    elements += (Paragraph(title, _pdf_paragraph_styles()[heading]), Spacer(1, space_before))
+    if rows:
+        table = Table([headers, *rows], colWidths=col_widths)
+        table.setStyle(style)
+        elements += (table, Spacer(1, space_after))
+
+
+@lru_cache(maxsize=64)
+def _trends_layout(n_cols: int):
+    """Column widths and body font size for a daily trends table with n_cols columns"""
+    # Dynamically fit columns to landscape page width (letter landscape ~720pt width, minus margins)
+    max_table_width = 700  # points, adjust as needed for margins
+    min_col_width = 40
+    max_col_width = 120
+    base_width = max_table_width // n_cols
+    col_widths = (max(min_col_width, min(base_width, max_col_width)),) * n_cols
+    # Shrink font size if too many columns
+    font_size = 9 if n_cols <= 10 else 7 if n_cols <= 16 else 6
+    return col_widths, font_size
+
+
+@lru_cache(maxsize=None)
+def _trends_table_style(font_size: int):
+    """TableStyle for the daily trends table, one per body font size"""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3498db")),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ("FONTSIZE", (0, 0), (-1, 0), font_size + 1),
+            ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
+            ("TOPPADDING", (0, 0), (-1, 0), 10),
+            ("BACKGROUND", (0, 1), (-1, -1), colors.white),
+            ("TEXTCOLOR", (0, 1), (-1, -1), colors.HexColor("#2c3e50")),
+            ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
+            ("FONTSIZE", (0, 1), (-1, -1), font_size),
+            ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#bdc3c7")),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f9f9f9")]),
+            ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
+            ("ALIGN", (0, 1), (0, -1), "LEFT"),
+            ("LEFTPADDING", (0, 0), (-1, -1), 6),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+        ]
+    )
+
 
 class BaseModel(models.Model):
     """Abstract base model with objects manager explicitly defined"""
@@ -75,60 +486,124 @@ class ImpactMetrics(BaseModel):
     def __str__(self):
         return f"Impact Metrics for {self.date}"
 
+    @staticmethod
+    def _transaction_totals():
+        """Aggregates for the food redistributed and its monetary value.
+
+        Listings without a price are valued at a default of $1 per kg.
+        """
+        return {
+            "total": Sum("request__quantity_requested"),
+            "monetary": Sum(
+                ExpressionWrapper(
+                    Coalesce(
+                        NullIf("request__listing__price", Value(_DEC_ZERO)),
+                        Value(_DEC_DEFAULT_PRICE),
+                    )
+                    * F("request__quantity_requested"),
+                    output_field=models.DecimalField(max_digits=12, decimal_places=2),
+                ),
+                filter=Q(request__quantity_requested__gt=0),
+            ),
+        }
+
+    @staticmethod
+    def _metric_values(total, monetary):
+        """Derive the stored metric fields from a day's transaction totals"""
+        food_redistributed = total or _DEC_ZERO
+
+        # For zero quantity, all metrics should be zero
+        if food_redistributed == _DEC_ZERO:
+            return {
+                "food_redistributed_kg": _DEC_ZERO,
+                "co2_emissions_saved": _DEC_ZERO,
+                "meals_provided": 0,
+                "monetary_value_saved": _DEC_ZERO,
+            }
+
+        return {
+            "food_redistributed_kg": food_redistributed,
+            "co2_emissions_saved": food_redistributed * _DEC_CO2,
+            "meals_provided": int(food_redistributed * _DEC_MEALS),
+            "monetary_value_saved": monetary or _DEC_ZERO,
+        }
+
     @classmethod
     def calculate_for_date(cls, date):
         """Calculate impact metrics for a specific date"""
-        # Get completed transactions for the date
-        transactions = Transaction.objects.filter(
-            status="COMPLETED", completion_date__date=date
-        ).select_related("request__listing")
-
-        # Calculate food redistributed
-        food_redistributed = transactions.aggregate(
-            total=Sum("request__quantity_requested")
-        )["total"] or Decimal("0")
+        # Half-open bounds keep the timestamp indexes usable, unlike __date casts
+        day_start, day_end = _day_bounds(date)
 
-        # For zero quantity, all metrics should be zero
-        if food_redistributed == Decimal("0"):
-            metrics, _ = cls.objects.update_or_create(
-                date=date,
-                defaults={
-                    "food_redistributed_kg": Decimal("0"),
-                    "co2_emissions_saved": Decimal("0"),
-                    "meals_provided": 0,
-                    "monetary_value_saved": Decimal("0"),
-                },
-            )
-            return metrics
-
-        # Calculate other metrics
-        co2_saved = food_redistributed * Decimal("2.5")
-        meals = int(food_redistributed * Decimal("2"))
-
-        # Calculate monetary value based on transaction quantity and listing price per unit
-        monetary_value = Decimal("0")
-        for transaction in transactions:
-            if transaction.request and transaction.request.listing:
-                quantity = transaction.request.quantity_requested
-                # Use listing price if available, otherwise use default value of $1 per kg
-                price = transaction.request.listing.price or Decimal("1.00")
-                if quantity > 0:
-                    monetary_value += (
-                        quantity * price
-                    )  # Calculate total value based on quantity and price
+        # Food redistributed and its monetary value come from one query
+        totals = Transaction.objects.filter(
+            status="COMPLETED",
+            completion_date__gte=day_start,
+            completion_date__lt=day_end,
+        ).aggregate(**cls._transaction_totals())
 
         # Create or update metrics
         metrics, _ = cls.objects.update_or_create(
             date=date,
-            defaults={
-                "food_redistributed_kg": food_redistributed,
-                "co2_emissions_saved": co2_saved,
-                "meals_provided": meals,
-                "monetary_value_saved": monetary_value,
-            },
+            defaults=cls._metric_values(totals["total"], totals["monetary"]),
         )
         return metrics
 
+    @classmethod
+    def calculate_for_range(cls, start_date, end_date, skip_empty=False):
+        """Calculate impact metrics for every date in a range.
+
+        The transaction totals come from a single query grouped by day, and the
+        rows are written with one bulk insert and one bulk update. With
+        skip_empty, days without completed transactions are left untouched.
+        """
+        range_start, _ = _day_bounds(start_date)
+        _, range_end = _day_bounds(end_date)
+        daily_totals = {
+            day: (total, monetary)
+            for day, total, monetary in Transaction.objects.filter(
+                status="COMPLETED",
+                completion_date__gte=range_start,
+                completion_date__lt=range_end,
+            )
+            .annotate(day=TruncDate("completion_date"))
+            .order_by()
+            .values("day")
+            .annotate(**cls._transaction_totals())
+            .values_list("day", "total", "monetary")
+        }
+
+        existing = {
+            metrics.date: metrics
+            for metrics in cls.objects.filter(date__range=[start_date, end_date])
+        }
+        to_create, to_update, results = [], [], []
+        day = start_date
+        while day <= end_date:
+            if day in daily_totals or not skip_empty:
+                values = cls._metric_values(*daily_totals.get(day, (None, None)))
+                metrics = existing.get(day)
+                if metrics is None:
+                    metrics = cls(date=day, **values)
+                    to_create.append(metrics)
+                else:
+                    for field, value in values.items():
+                        setattr(metrics, field, value)
+                    to_update.append(metrics)
+                results.append(metrics)
+            day += timedelta(days=1)
+
+        cls.objects.bulk_create(to_create)
+        cls.objects.bulk_update(
+            to_update,
+            [
+                "food_redistributed_kg",
+                "co2_emissions_saved",
+                "meals_provided",
+                "monetary_value_saved",
+            ],
+        )
+        return results
+
 
 class DailyAnalytics(BaseModel):
     """Tracks daily analytics per user/listing"""
@@ -149,6 +624,25 @@ class DailyAnalytics(BaseModel):
             models.Index(fields=["date", "user"]),
             models.Index(fields=["date", "listing"]),
         ]
+        # Mirror clean() in the database so atomic F() increments stay valid
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(requests_received__gte=0),
+                name="dailyanalytics_requests_received_gte_0",
+            ),
+            models.CheckConstraint(
+                condition=Q(requests_fulfilled__gte=0),
+                name="dailyanalytics_requests_fulfilled_gte_0",
+            ),
+            models.CheckConstraint(
+                condition=Q(food_saved_kg__gte=0),
+                name="dailyanalytics_food_saved_kg_gte_0",
+            ),
+            models.CheckConstraint(
+                condition=Q(requests_fulfilled__lte=F("requests_received")),
+                name="dailyanalytics_fulfilled_lte_received",
+            ),
+        ]
 
     def __str__(self):
         return f"Analytics for {self.listing.title} on {self.date}"
@@ -178,18 +672,38 @@ class DailyAnalytics(BaseModel):
             defaults={
                 "requests_received": 0,
                 "requests_fulfilled": 0,
-                "food_saved_kg": Decimal("0.00"),
+                "food_saved_kg": _DEC_CENTS_ZERO,
             },
         )
         return analytics
 
     def increment_metrics(self, food_quantity):
-        """Increment metrics with validation"""
+        """Increment metrics in a single atomic UPDATE.
+
+        The table's check constraints reject invalid totals, so the row is
+        neither re-read nor re-validated in Python: a saved row that would
+        break them raises IntegrityError rather than ValidationError. An
+        unsaved instance has no row to update yet, so it is incremented,
+        validated with full_clean() and inserted instead.
+        """
+        quantity = (
+            food_quantity
+            if isinstance(food_quantity, Decimal)
+            else Decimal(str(food_quantity))
+        )
+        if self.pk is not None:
+            type(self).objects.filter(pk=self.pk).update(
+                requests_received=F("requests_received") + 1,
+                requests_fulfilled=F("requests_fulfilled") + 1,
+                food_saved_kg=F("food_saved_kg") + quantity,
+            )
+        # Mirror the increment on this instance without another query
         self.requests_received += 1
         self.requests_fulfilled += 1
-        self.food_saved_kg += Decimal(str(food_quantity))
-        self.full_clean()
-        self.save()
+        self.food_saved_kg += quantity
+        if self.pk is None:
+            self.full_clean()
+            self.save()
 
 
 class SystemMetrics(BaseModel):
@@ -295,105 +809,138 @@ class SystemMetrics(BaseModel):
     def calculate_for_date(cls, date):
         """Calculate system metrics for a specific date"""
         User = get_user_model()
+        day_start, day_end = _day_bounds(date)
 
         # Consider a user active if they've logged in within the last 30 days OR if they have any activity today
         active_date_range = {
-            "last_login__date__gte": date - timezone.timedelta(days=30),
-            "last_login__date__lte": date,
+            "last_login__gte": day_start - timedelta(days=30),
+            "last_login__lt": day_end,
         }
 
-        # Include users who have any activity today (requests, listings, etc.)
-        today_active_users = set(
-            User.objects.filter(**active_date_range).values_list("id", flat=True)
-        )
-
-        # Add users who created listings today
-        today_active_users.update(
-            FoodListing.objects.filter(created_at__date=date).values_list(
-                "supplier_id", flat=True
-            )
-        )
-
-        # Add users who made requests today
-        today_active_users.update(
-            FoodRequest.objects.filter(created_at__date=date).values_list(
-                "requester_id", flat=True
-            )
-        )
-
-        # Add users who completed transactions today
-        today_active_users.update(
-            Transaction.objects.filter(completion_date__date=date).values_list(
-                "request__requester_id", flat=True
-            )
-        )
-        today_active_users.update(
-            Transaction.objects.filter(completion_date__date=date).values_list(
-                "request__listing__supplier_id", flat=True
+        # Include users who have any activity today (requests, listings, etc.).
+        # The id sources are combined with a UNION ALL that stays server-side as
+        # the subquery of the per-type GROUP BY below; the outer IN semi-join
+        # deduplicates, so no Python set or literal id list is ever built
+        today_active_users = (
+            User.objects.filter(**active_date_range)
+            .order_by()
+            .values_list("id", flat=True)
+            .union(
+                # Users who created listings today
+                FoodListing.objects.filter(
+                    created_at__gte=day_start, created_at__lt=day_end
+                )
+                .order_by()
+                .values_list("supplier_id", flat=True),
+                # Users who made requests today
+                FoodRequest.objects.filter(
+                    created_at__gte=day_start, created_at__lt=day_end
+                )
+                .order_by()
+                .values_list("requester_id", flat=True),
+                # Users who completed transactions today
+                Transaction.objects.filter(
+                    completion_date__gte=day_start, completion_date__lt=day_end
+                )
+                .order_by()
+                .values_list("request__requester_id", flat=True),
+                Transaction.objects.filter(
+                    completion_date__gte=day_start, completion_date__lt=day_end
+                )
+                .order_by()
+                .values_list("request__listing__supplier_id", flat=True),
+                # Users with delivery activity today
+                DeliveryAssignment.objects.filter(
+                    # New, picked up and completed deliveries
+                    models.Q(created_at__gte=day_start, created_at__lt=day_end)
+                    | models.Q(picked_up_at__gte=day_start, picked_up_at__lt=day_end)
+                    | models.Q(delivered_at__gte=day_start, delivered_at__lt=day_end),
+                    volunteer_id__isnull=False,
+                )
+                .order_by()
+                .values_list("volunteer_id", flat=True),
+                all=True,
             )
         )
 
-        # Add users with delivery activity today
-        today_active_users.update(
-            DeliveryAssignment.objects.filter(
-                models.Q(created_at__date=date)  # New delivery assignments
-                | models.Q(picked_up_at__date=date)  # Picked up deliveries
-                | models.Q(delivered_at__date=date)  # Completed deliveries
-            ).values_list("volunteer_id", flat=True)
-        )
-
-        # Count active users by type
-        active_users = len(today_active_users)
-
         # Get users who registered today
-        new_users = User.objects.filter(date_joined__date=date).count()
+        new_users = User.objects.filter(
+            date_joined__gte=day_start, date_joined__lt=day_end
+        ).count()
 
         # Count active users by type within today's active users
-        business_users_active = User.objects.filter(
-            id__in=today_active_users, user_type="BUSINESS"
-        ).count()
-        nonprofit_users_active = User.objects.filter(
-            id__in=today_active_users, user_type="NONPROFIT"
-        ).count()
-        volunteer_users_active = User.objects.filter(
-            id__in=today_active_users, user_type="VOLUNTEER"
-        ).count()
-        consumer_users_active = User.objects.filter(
-            id__in=today_active_users, user_type="CONSUMER"
-        ).count()
+        active_by_type = dict(
+            User.objects.filter(id__in=today_active_users)
+            .values("user_type")
+            .annotate(count=Count("id"))
+            .values_list("user_type", "count")
+        )
+        active_users = sum(active_by_type.values())
+        business_users_active = active_by_type.get("BUSINESS", 0)
+        nonprofit_users_active = active_by_type.get("NONPROFIT", 0)
+        volunteer_users_active = active_by_type.get("VOLUNTEER", 0)
+        consumer_users_active = active_by_type.get("CONSUMER", 0)
 
         # Platform performance metrics
-        new_listings = FoodListing.objects.filter(created_at__date=date).count()
-        requests_created = FoodRequest.objects.filter(created_at__date=date).count()
-        deliveries_created = DeliveryAssignment.objects.filter(
-            created_at__date=date
+        new_listings = FoodListing.objects.filter(
+            created_at__gte=day_start, created_at__lt=day_end
         ).count()
+        requests_created = FoodRequest.objects.filter(
+            created_at__gte=day_start, created_at__lt=day_end
+        ).count()
+        # Delivery counters for the day come from one conditional aggregate
+        delivery_counts = DeliveryAssignment.objects.filter(
+            models.Q(created_at__gte=day_start, created_at__lt=day_end)
+            | models.Q(delivered_at__gte=day_start, delivered_at__lt=day_end)
+        ).aggregate(
+            created=Count(
+                "id", filter=Q(created_at__gte=day_start, created_at__lt=day_end)
+            ),
+            completed=Count(
+                "id",
+                filter=Q(
+                    delivered_at__gte=day_start,
+                    delivered_at__lt=day_end,
+                    status="DELIVERED",
+                ),
+            ),
+        )
+        deliveries_created = delivery_counts["created"]
 
-        # Calculate average response time (in hours, float)
-        response_times_qs = (
-            FoodRequest.objects.filter(
-                status__in=["APPROVED", "REJECTED"], updated_at__date=date
-            )
-            .annotate(
-                response_time=ExpressionWrapper(
+        # Requests processed today: approval counts and the average response
+        # time (ignoring outliers > 48 hours) come from one conditional aggregate
+        processed_requests = FoodRequest.objects.filter(
+            updated_at__gte=day_start,
+            updated_at__lt=day_end,
+            status__in=["APPROVED", "REJECTED"],
+        ).aggregate(
+            total=Count("id"),
+            approved=Count("id", filter=Q(status="APPROVED")),
+            avg_time=Avg(
+                ExpressionWrapper(
                     F("updated_at") - F("created_at"),
                     output_field=models.DurationField(),
-                )
-            )
-            .filter(response_time__lte=timedelta(hours=48))  # Ignore outliers > 48 hours
+                ),
+                filter=Q(updated_at__lte=F("created_at") + timedelta(hours=48)),
+            ),
         )
-        response_times = response_times_qs.aggregate(avg_time=Avg("response_time"), count=Count("id"))
+
+        # Calculate average response time (in hours, float)
         avg_response_time = None
-        if response_times["count"] > 0 and response_times["avg_time"]:
+        if processed_requests["avg_time"]:
             # Convert timedelta to hours as float
-            total_seconds = response_times["avg_time"].total_seconds()
+            total_seconds = processed_requests["avg_time"].total_seconds()
             avg_response_time = round(total_seconds / 3600, 2)
 
         # Calculate average transaction value including both commercial and donation listings
-        transaction_values = (
-            Transaction.objects.filter(completion_date__date=date, status="COMPLETED")
-            .annotate(
-                value=Case(
+        # Donations are valued at the base rate of $1 per kg, i.e. their quantity
+        transaction_values = Transaction.objects.filter(
+            completion_date__gte=day_start,
+            completion_date__lt=day_end,
+            status="COMPLETED",
+        ).aggregate(
+            avg_value=Avg(
+                Case(
                     When(
                         request__listing__listing_type="COMMERCIAL",
                         then=F("request__listing__price")
@@ -401,75 +948,72 @@ class SystemMetrics(BaseModel):
                     ),
                     When(
                         request__listing__listing_type="DONATION",
-                        then=F("request__quantity_requested")
-                        * Value(Decimal("1.00")),  # Base value for donations
+                        then=F("request__quantity_requested"),
                     ),
-                    default=Value(Decimal("0.00")),
+                    default=Value(_DEC_CENTS_ZERO),
                     output_field=models.DecimalField(max_digits=10, decimal_places=2),
                 )
             )
-            .aggregate(avg_value=Avg("value"), count=Count("id"))
         )
 
         # Calculate request approval rate
-        total_requests_processed = FoodRequest.objects.filter(
-            updated_at__date=date, status__in=["APPROVED", "REJECTED"]
-        ).count()
+        total_requests_processed = processed_requests["total"]
+        approved_requests = processed_requests["approved"]
 
-        approved_requests = FoodRequest.objects.filter(
-            updated_at__date=date, status="APPROVED"
-        ).count()
-
-        request_approval_rate = Decimal("0.00")
+        request_approval_rate = _DEC_CENTS_ZERO
         if total_requests_processed > 0:
             request_approval_rate = (
                 Decimal(approved_requests) / Decimal(total_requests_processed) * 100
             )
 
         # Calculate transaction completion rate
-        total_transactions = Transaction.objects.filter(
-            transaction_date__date=date
-        ).count()
-
-        completed_transactions = Transaction.objects.filter(
-            completion_date__date=date, status="COMPLETED"
-        ).count()
+        transaction_counts = Transaction.objects.filter(
+            models.Q(transaction_date__gte=day_start, transaction_date__lt=day_end)
+            | models.Q(completion_date__gte=day_start, completion_date__lt=day_end)
+        ).aggregate(
+            total=Count(
+                "id",
+                filter=Q(transaction_date__gte=day_start, transaction_date__lt=day_end),
+            ),
+            completed=Count(
+                "id",
+                filter=Q(
+                    completion_date__gte=day_start,
+                    completion_date__lt=day_end,
+                    status="COMPLETED",
+                ),
+            ),
+        )
+        total_transactions = transaction_counts["total"]
+        completed_transactions = transaction_counts["completed"]
 
-        transaction_completion_rate = Decimal("0.00")
+        transaction_completion_rate = _DEC_CENTS_ZERO
         if total_transactions > 0:
             transaction_completion_rate = (
                 Decimal(completed_transactions) / Decimal(total_transactions) * 100
             )
 
         # Calculate delivery completion rate
-        total_deliveries = DeliveryAssignment.objects.filter(
-            created_at__date=date
-        ).count()
+        total_deliveries = delivery_counts["created"]
+        completed_deliveries = delivery_counts["completed"]
 
-        completed_deliveries = DeliveryAssignment.objects.filter(
-            delivered_at__date=date, status="DELIVERED"
-        ).count()
-
-        delivery_completion_rate = Decimal("0.00")
+        delivery_completion_rate = _DEC_CENTS_ZERO
         if total_deliveries > 0:
             delivery_completion_rate = (
                 Decimal(completed_deliveries) / Decimal(total_deliveries) * 100
             )
 
-        # Calculate average rating for completed transactions
-        completed_transactions_today = Transaction.objects.filter(
-            completion_date__date=date, status="COMPLETED"
+        # Calculate average rating for completed transactions. Avg is NULL when
+        # nothing was completed, so no separate existence check is needed
+        ratings = Rating.objects.filter(
+            transaction__status="COMPLETED",
+            transaction__completion_date__gte=day_start,
+            transaction__completion_date__lt=day_end,
+        ).aggregate(avg=Avg("rating"))
+        avg_rating = (
+            Decimal(str(ratings["avg"])) if ratings["avg"] else _DEC_CENTS_ZERO
         )
 
-        avg_rating = Decimal("0.00")
-        if completed_transactions_today.exists():
-            ratings = Rating.objects.filter(
-                transaction__completion_date__date__range=[date, date]
-            ).aggregate(avg=Avg("rating"))
-            avg_rating = (
-                Decimal(str(ratings["avg"])) if ratings["avg"] else Decimal("0.00")
-            )
-
         # Create or update metrics
         metrics, _ = cls.objects.update_or_create(
             date=date,
@@ -485,7 +1029,7 @@ class SystemMetrics(BaseModel):
                 "delivery_count": deliveries_created,
                 "avg_response_time": avg_response_time,
                 "avg_transaction_value": transaction_values["avg_value"]
-                or Decimal("0.00"),
+                or _DEC_CENTS_ZERO,
                 "request_approval_rate": request_approval_rate,
                 "transaction_completion_rate": transaction_completion_rate,
                 "delivery_completion_rate": delivery_completion_rate,
@@ -541,6 +1085,83 @@ class Report(BaseModel):
         ("QUARTERLY", "Quarterly"),
     ]
 
+    # Payload builder for each report type, resolved by name on dispatch
+    REPORT_BUILDERS = {
+        "IMPACT": "_compute_impact_report",
+        "TRANSACTION": "_compute_transaction_report",
+        "USER_ACTIVITY": "_compute_user_activity_report",
+        "COMPLIANCE": "_compute_compliance_report",
+        "SYSTEM": "_compute_system_performance_report",
+        "SUPPLIER": "_compute_supplier_performance_report",
+        "WASTE_REDUCTION": "_compute_waste_reduction_report",
+        "BENEFICIARY": "_compute_beneficiary_impact_report",
+        "VOLUNTEER": "_compute_volunteer_performance_report",
+        "EXPIRY_WASTE": "_compute_expiry_waste_report",
+        "USER_RETENTION": "_compute_user_retention_churn_report",
+    }
+
+    # Report types whose payloads are cached once their date window has closed.
+    # Only the system report qualifies: it reads the daily SystemMetrics
+    # snapshots, while the other reports read live transactions and deliveries
+    # whose status can still change after the window closes.
+    CACHED_REPORT_TYPES = frozenset({"SYSTEM"})
+
+    # The analytics cache is per process, so nothing can invalidate a cached
+    # payload in every worker; a short timeout bounds how stale it can get
+    REPORT_PAYLOAD_CACHE_TIMEOUT = 300
+
+    # xlsxwriter formats belong to a workbook, so only their specs are shared
+    EXCEL_FORMATS = {
+        "title": {
+            "bold": True,
+            "font_size": 16,
+            "font_color": "#2c3e50",
+            "align": "center",
+            "valign": "vcenter",
+            "border": 0,
+        },
+        "header": {
+            "bold": True,
+            "font_size": 11,
+            "bg_color": "#3498db",
+            "font_color": "white",
+            "align": "center",
+            "valign": "vcenter",
+            "border": 1,
+            "border_color": "#2980b9",
+        },
+        "subheader": {
+            "bold": True,
+            "font_size": 11,
+            "font_color": "#2c3e50",
+            "align": "left",
+            "valign": "vcenter",
+        },
+        "cell": {
+            "font_size": 10,
+            "align": "left",
+            "valign": "vcenter",
+            "border": 1,
+            "border_color": "#bdc3c7",
+        },
+        "number": {
+            "font_size": 10,
+            "align": "right",
+            "valign": "vcenter",
+            "border": 1,
+            "border_color": "#bdc3c7",
+            "num_format": "#,##0.00",
+        },
+        "date": {
+            "font_size": 10,
+            "align": "left",
+            "valign": "vcenter",
+            "border": 1,
+            "border_color": "#bdc3c7",
+            "num_format": "mmm d yyyy",
+        },
+    }
+
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     report_type = models.CharField(max_length=20, choices=REPORT_TYPES)
@@ -586,28 +1207,11 @@ class Report(BaseModel):
         if not isinstance(self.data, dict):
             raise ValidationError("Report data must be a dictionary")
 
-        required_keys = {
-            "IMPACT": ["summary", "daily_trends"],
-            "TRANSACTION": ["metrics", "status_breakdown"],
-            "USER_ACTIVITY": [
-                "total_activities",
-                "unique_users",
-                "activity_types",
-                "user_type_breakdown",
-            ],
-            "COMPLIANCE": [
-                "total_listings",
-                "total_checks",
-                "passed",
-                "failed",
-                "compliance_rate",
-            ],
-            "SYSTEM": ["summary", "daily_trends"],
-        }
-
-        if self.report_type in required_keys:
+        if self.report_type in _REQUIRED_DATA_KEYS:
             missing_keys = [
-                key for key in required_keys[self.report_type] if key not in self.data
+                key
+                for key in _REQUIRED_DATA_KEYS[self.report_type]
+                if key not in self.data
             ]
             if missing_keys:
                 raise ValidationError(
@@ -639,15 +1243,12 @@ class Report(BaseModel):
                     # Parse the time string into a time object
                     if isinstance(schedule_time, str):
                         # Handle different time formats (HH:MM or HH:MM:SS)
-                        time_parts = schedule_time.split(':')
-                        if len(time_parts) == 2:
-                            hour, minute = map(int, time_parts)
-                            self.schedule_time = time(hour, minute)
-                        elif len(time_parts) == 3:
-                            hour, minute, second = map(int, time_parts)
-                            self.schedule_time = time(hour, minute, second)
-                        else:
-                            raise ValueError(f"Invalid time format: {schedule_time}")
+                        time_format = (
+                            "%H:%M:%S" if schedule_time.count(":") == 2 else "%H:%M"
+                        )
+                        self.schedule_time = datetime.strptime(
+                            schedule_time, time_format
+                        ).time()
                     elif isinstance(schedule_time, time):
                         self.schedule_time = schedule_time
                     else:
@@ -686,7 +1287,9 @@ class Report(BaseModel):
             self.is_scheduled = False
             self.schedule_frequency = None
             self.schedule_time = None
-            self.save()
+            self.save(
+                update_fields=["is_scheduled", "schedule_frequency", "schedule_time"]
+            )
 
             return {"status": "success", "message": "Report unscheduled successfully"}
 
@@ -699,24 +1302,28 @@ class Report(BaseModel):
             return None
 
         now = timezone.now()
+        today = now.date()
+        run_time = self.schedule_time or time(0, 0)
+
+        def at(day):
+            return timezone.make_aware(datetime.combine(day, run_time))
+
         if self.schedule_frequency == "DAILY":
-            next_run = timezone.make_aware(
-                datetime.combine(now.date(), self.schedule_time or time(0, 0))
-            )
+            next_run = at(today)
             if next_run <= now:
-                next_run += timedelta(days=1)
+                next_run = at(today + timedelta(days=1))
         elif self.schedule_frequency == "WEEKLY":
-            next_run = timezone.make_aware(
-                datetime.combine(now.date(), self.schedule_time or time(0, 0))
-            )
-            while next_run <= now or next_run.weekday() != 0:  # Schedule for Mondays
-                next_run += timedelta(days=1)
+            # Schedule for Mondays: jump straight to the coming Monday
+            monday = today + timedelta(days=-today.weekday() % 7)
+            next_run = at(monday)
+            if next_run <= now:
+                next_run = at(monday + timedelta(days=7))
         elif self.schedule_frequency == "MONTHLY":
-            next_run = timezone.make_aware(
-                datetime.combine(now.date(), self.schedule_time or time(0, 0))
-            )
-            while next_run <= now or next_run.day != 1:  # Schedule for 1st of month
-                next_run += timedelta(days=1)
+            # Schedule for 1st of month: today if still ahead, else next month
+            next_run = at(today) if today.day == 1 else None
+            if next_run is None or next_run <= now:
+                first_of_next = (today.replace(day=1) + timedelta(days=32)).replace(day=1)
+                next_run = at(first_of_next)
         return next_run
 
     def generate_report(self):
@@ -725,63 +1332,56 @@ class Report(BaseModel):
             raise ValidationError("Report type is required")
 
         try:
-            # Map to appropriate generator methods
-            report_generators = {
-                "IMPACT": self.__class__.generate_impact_report,
-                "TRANSACTION": self.__class__.generate_transaction_report,
-                "USER_ACTIVITY": self.__class__.generate_user_activity_report,
-                "COMPLIANCE": self.__class__.generate_compliance_report,
-                "SYSTEM": self.__class__.generate_system_performance_report,
-                "SUPPLIER": self.__class__.generate_supplier_performance_report,
-                "WASTE_REDUCTION": self.__class__.generate_waste_reduction_report,
-                "BENEFICIARY": self.__class__.generate_beneficiary_impact_report,
-                "VOLUNTEER": self.__class__.generate_volunteer_performance_report,
-                "EXPIRY_WASTE": self.__class__.generate_expiry_waste_report,
-                "USER_RETENTION": self.__class__.generate_user_retention_churn_report,
-            }
-            
-            if self.report_type not in report_generators:
-                raise ValueError(f"Unsupported report type: {self.report_type}")
-
-            # Generate a new report using the appropriate class method
-            generator_method = report_generators[self.report_type]
-            new_report = generator_method(
-                start_date=self.date_range_start,
-                end_date=self.date_range_end,
-                user=self.generated_by,
-                title=self.title
+            # Compute the payload in memory; no temporary report row is
+            # written, and any cached payload for the window is refreshed
+            self.data, self.summary = type(self)._build_report_payload(
+                self.report_type,
+                self.date_range_start,
+                self.date_range_end,
+                self.generated_by,
+                refresh=True,
             )
-
-            # Copy data from the new report to this report
-            self.data = new_report.data
-            self.summary = new_report.summary
             self.date_generated = timezone.now()
-            
-            # Delete the temporary report since we've copied its data
-            new_report.delete()
-            
-            # Save the updated report
-            self.save()
+
+            # Save only the regenerated fields
+            self.save(update_fields=["data", "summary", "date_generated"])
             
             return True
-        except Exception as e:
-            # Log the error but don't raise to allow for user-friendly error messages
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error generating report: {str(e)}")
+        except Exception:
+            logger.exception("Error generating report %s", self.pk)
             raise
 
     def save(self, *args, **kwargs):
-        """Ensure data is valid before saving"""
-        self.full_clean()
+        """Save without re-validating; user-facing writes call full_clean() first"""
         super().save(*args, **kwargs)
+        # Saved fields may have changed, so rebuild export metadata on next use
+        self.__dict__.pop("_export_metadata", None)
+
+    # Columns needed to list reports: skips the large JSON data field and the
+    # rest of the joined user row
+    LIST_COLUMNS = (
+        "id",
+        "title",
+        "report_type",
+        "summary",
+        "date_generated",
+        "date_range_start",
+        "date_range_end",
+        "is_scheduled",
+        "schedule_frequency",
+        "schedule_time",
+        "generated_by__id",
+        "generated_by__email",
+        "generated_by__first_name",
+        "generated_by__last_name",
+    )
 
     @classmethod
     def get_recent_reports(cls, limit=10):
         """Get recent reports with optimized querying"""
         return (
             cls.objects.select_related("generated_by")
-            .defer("data")  # Defer loading large JSON data field
+            .only(*cls.LIST_COLUMNS)
             .order_by("-date_generated")[:limit]
         )
 
@@ -791,14 +1391,86 @@ class Report(BaseModel):
         qs = cls.objects.select_related("generated_by").filter(is_scheduled=True)
         if active_only:
             qs = qs.filter(date_generated__gte=timezone.now() - timedelta(days=90))
-        return qs.defer("data").order_by("-date_generated")
+        return qs.only(*cls.LIST_COLUMNS).order_by("-date_generated")
+
+    @cached_property
+    def _export_metadata(self) -> Dict[str, str]:
+        """Formatted report details shared by the PDF, CSV and Excel exporters"""
+        # No request activates a per-user timezone, so convert straight to the
+        # project zone; get_default_timezone() is cached by Django
+        date_generated = self.date_generated.astimezone(timezone.get_default_timezone())
+        return {
+            "report_type": _REPORT_TYPE_MAP.get(self.report_type, "Unknown"),
+            "generated": date_generated.strftime("%B %d, %Y at %I:%M %p"),
+            "date_range": f"{self.date_range_start.strftime('%B %d, %Y')} to {self.date_range_end.strftime('%B %d, %Y')}",
+            "generated_by": self.generated_by.get_full_name() or self.generated_by.email,
+        }
+
+    def _pdf_cache_key(self) -> str:
+        """Cache key for the rendered PDF, derived from every field the PDF shows"""
+        payload = json.dumps(
+            [
+                self.data,
+                self.summary,
+                self.title,
+                self.report_type,
+                str(self.date_generated),
+                str(self.date_range_start),
+                str(self.date_range_end),
+                self._export_metadata["generated_by"],
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return f"report_pdf:{self.pk}:{hashlib.md5(payload.encode()).hexdigest()}"
 
     def export_as_pdf(self) -> HttpResponse:
         """Export report as PDF using reportlab"""
-        buffer = BytesIO()
+        # A report's rendered PDF only changes when its content does, and the
+        # cache key hashes that content, so an edited report never hits a stale entry
+        pdf_cache = caches["analytics"]
+        cache_key = self._pdf_cache_key()
+        response = HttpResponse(content_type="application/pdf")
+        response["Content-Disposition"] = (
+            f'attachment; filename="{str(self.title).replace(" ", "_")}.pdf"'
+        )
+        pdf = pdf_cache.get(cache_key)
+        if pdf is not None:
+            response.write(pdf)
+            return response
+
+        # reportlab writes the document straight into the response, which is
+        # file-like, rather than into a BytesIO that then has to be copied over
+        self._write_pdf(response)
+        pdf_cache.set(cache_key, response.content, 3600)
+        return response
+
+    def render_pdf(self) -> bytes:
+        """Return the report as PDF bytes, for use outside a request (e.g. the email task)"""
+        pdf_cache = caches["analytics"]
+        cache_key = self._pdf_cache_key()
+        pdf = pdf_cache.get(cache_key)
+        if pdf is None:
+            buffer = BytesIO()
+            self._write_pdf(buffer)
+            pdf = buffer.getvalue()
+            pdf_cache.set(cache_key, pdf, 3600)
+        return pdf
+
+    def _write_pdf(self, output) -> None:
+        """Render the report PDF into a writable file-like object"""
+        # reportlab is only needed when rendering, so keep it out of module import
+        from reportlab.lib.pagesizes import letter, landscape
+        from reportlab.platypus import (
+            Paragraph,
+            SimpleDocTemplate,
+            Spacer,
+            Table,
+        )
+
         # Use landscape orientation for wide tables
         doc = SimpleDocTemplate(
-            buffer,
+            output,
             pagesize=landscape(letter),
             rightMargin=50,
             leftMargin=50,
@@ -807,83 +1479,42 @@ class Report(BaseModel):
             title=self.title,
         )
 
-        elements = []
-        styles = getSampleStyleSheet()
-
-        # Enhanced title style
-        title_style = ParagraphStyle(
-            "CustomTitle",
-            parent=styles["Heading1"],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=colors.HexColor("#2c3e50"),
-            alignment=1,  # Center alignment
-        )
-        elements.append(Paragraph(str(self.title), title_style))
-
-        # Enhanced info section style
-        info_style = ParagraphStyle(
-            "InfoStyle",
-            parent=styles["Normal"],
-            fontSize=10,
-            textColor=colors.HexColor("#34495e"),
-            spaceAfter=5,
-            bulletIndent=20,
-            leftIndent=20,
-        )
+        styles = _pdf_paragraph_styles()
+        elements = [Paragraph(str(self.title), styles["CustomTitle"])]
 
         try:
-            # Format dates
-            date_generated = timezone.localtime(self.date_generated)
-            date_range_start = timezone.localtime(
-                timezone.make_aware(
-                    datetime.combine(self.date_range_start, datetime.min.time())
-                )
-            )
-            date_range_end = timezone.localtime(
-                timezone.make_aware(
-                    datetime.combine(self.date_range_end, datetime.min.time())
-                )
-            )
-
             # Add report info
+            metadata = self._export_metadata
             info_data = [
-                f"Report Type: {dict(self.REPORT_TYPES).get(self.report_type, 'Unknown')}",
-                f"Generated: {date_generated.strftime('%B %d, %Y at %I:%M %p')}",
-                f"Date Range: {date_range_start.strftime('%B %d, %Y')} to {date_range_end.strftime('%B %d, %Y')}",
-                f"Generated By: {self.generated_by.get_full_name() if hasattr(self.generated_by, 'get_full_name') else self.generated_by.email}",
+                f"Report Type: {metadata['report_type']}",
+                f"Generated: {metadata['generated']}",
+                f"Date Range: {metadata['date_range']}",
+                f"Generated By: {metadata['generated_by']}",
             ]
 
-            for info in info_data:
-                elements.append(Paragraph(f"• {info}", info_style))
-
+            info_style = styles["InfoStyle"]
+            elements += [Paragraph(info, info_style, bulletText="•") for info in info_data]
             elements.append(Spacer(1, 20))
 
             # Add summary with enhanced styling and proper spacing
             if self.summary:
-                summary_style = ParagraphStyle(
-                    "SummaryStyle",
-                    parent=styles["Normal"],
-                    fontSize=12,
-                    textColor=colors.HexColor("#2c3e50"),
-                    backColor=colors.HexColor("#ecf0f1"),
-                    borderPadding=15,  # Increased padding
-                    borderRadius=5,
-                    spaceAfter=20,  # Add space after summary
-                    spaceBefore=10,  # Add space before summary
+                elements += (
+                    Paragraph("Summary", styles["Heading2"]),
+                    Spacer(1, 10),  # Add space between heading and content
+                    Paragraph(str(self.summary), styles["SummaryStyle"]),
+                    Spacer(1, 20),
                 )
-                elements.append(Paragraph("Summary", styles["Heading2"]))
-                elements.append(Spacer(1, 10))  # Add space between heading and content
-                elements.append(Paragraph(str(self.summary), summary_style))
-                elements.append(Spacer(1, 20))
 
             # Add data sections
             report_data = self.data if isinstance(self.data, dict) else {}
+            metrics = report_data.get("metrics")
+            if not isinstance(metrics, dict):
+                metrics = {}
+            peak_data = metrics.get("peak_rescue_times")
 
             # Annotations, Aggregate metrics
-            if report_data.get("metrics") and isinstance(report_data["metrics"], dict):
-                elements.append(Paragraph("Key Metrics", styles["Heading2"]))
-                elements.append(Spacer(1, 10))  # Add space after heading
+            if metrics:
+                elements += (Paragraph("Key Metrics", styles["Heading2"]), Spacer(1, 10))
 
                 metrics_data = [
                     [
@@ -894,16 +1525,9 @@ class Report(BaseModel):
 
                 # Format metrics data - exclude nested structures
                 formatted_metrics = {}
-                for key, value in report_data["metrics"].items():
-                    # Skip nested data structures that will be shown in separate tables
-                    skip_keys = ['top_suppliers', 'food_categories', 'rescued_by_category', 'peak_rescue_times']
-                    # Add expiry waste report keys to skip
-                    if self.report_type == 'EXPIRY_WASTE':
-                        skip_keys += ['suppliers_with_most_expired', 'expired_by_food_type']
-                    if self.report_type == 'BENEFICIARY':
-                        skip_keys += ['nutritional_value', 'satisfaction_metrics', 'food_by_beneficiary_type']
-                    if self.report_type == 'VOLUNTEER':
-                        skip_keys += ['top_volunteers', 'activity_by_day', 'volunteer_reliability']
+                # Skip nested data structures that will be shown in separate tables
+                skip_keys = _SKIP_KEYS_BY_TYPE.get(self.report_type, _NESTED_METRIC_KEYS)
+                for key, value in metrics.items():
                     if key in skip_keys:
                         continue
                     
@@ -911,11 +1535,10 @@ class Report(BaseModel):
                     formatted_key = key.replace("_", " ").title()
                     
                     # Format numeric values with proper decimal places
-                    if isinstance(value, (int, float)):
-                        if float(value) == int(float(value)):  # whole number
-                            formatted_value = "{:,}".format(int(value))
-                        else:
-                            formatted_value = "{:,.1f}".format(float(value))
+                    if isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
+                        formatted_value = _format_int(int(value))  # whole number
+                    elif isinstance(value, float):
+                        formatted_value = f"{value:,.1f}"
                     else:
                         formatted_value = str(value)
                         
@@ -927,163 +1550,15 @@ class Report(BaseModel):
 
                 if len(metrics_data) > 1:  # if we have data beyond just the header
                     table = Table(metrics_data, colWidths=[250, 250])
-                    table.setStyle(
-                        TableStyle(
-                            [
-                                (
-                                    "BACKGROUND",
-                                    (0, 0),
-                                    (-1, 0),
-                                    colors.HexColor("#3498db"),
-                                ),
-                                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                                ("FONTSIZE", (0, 0), (-1, 0), 12),
-                                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                                (
-                                    "TEXTCOLOR",
-                                    (0, 1),
-                                    (-1, -1),
-                                    colors.HexColor("#2c3e50"),
-                                ),
-                                ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                                ("FONTSIZE", (0, 1), (-1, -1), 10),
-                                (
-                                    "GRID",
-                                    (0, 0),
-                                    (-1, -1),
-                                    1,
-                                    colors.HexColor("#bdc3c7"),
-                                ),
-                                (
-                                    "ROWBACKGROUNDS",
-                                    (0, 1),
-                                    (-1, -1),
-                                    [colors.white, colors.HexColor("#f9f9f9")],
-                                ),
-                                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                                ("LEFTPADDING", (0, 0), (-1, -1), 15),
-                            ]
-                        )
-                    )
-                    elements.append(table)
-                    elements.append(Spacer(1, 20))
-                    
-                # Add top suppliers table if available
-                if 'top_suppliers' in report_data["metrics"] and isinstance(report_data["metrics"]['top_suppliers'], list):
-                    elements.append(Paragraph("Top Suppliers", styles["Heading2"]))
-                    elements.append(Spacer(1, 10))
-                    
-                    supplier_data = [
-                        ["Supplier", "Transaction Count", "Total Food (kg)"]
-                    ]
+                    table.setStyle(_pdf_table_styles()["metrics"])
+                    elements += (table, Spacer(1, 20))
                     
-                    for supplier in report_data["metrics"]['top_suppliers']:
-                        if isinstance(supplier, dict):
-                            supplier_name = supplier.get('supplier_name', 'Unknown')
-                            transaction_count = str(supplier.get('transaction_count', 0))
-                            total_food = "{:.1f}".format(float(supplier.get('total_food_kg', 0)))
-                            supplier_data.append([supplier_name, transaction_count, total_food])
-                    
-                    if len(supplier_data) > 1:  # if we have data beyond just the header
-                        supplier_table = Table(supplier_data, colWidths=[200, 150, 150])
-                        supplier_table.setStyle(
-                            TableStyle([
-                                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3498db")),
-                                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                                ("FONTSIZE", (0, 0), (-1, 0), 11),
-                                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                                ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#bdc3c7")),
-                                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f9f9f9")]),
-                                ("ALIGN", (1, 1), (1, -1), "RIGHT"),  # Right align transaction count
-                                ("ALIGN", (2, 1), (2, -1), "RIGHT"),  # Right align total food
-                            ])
-                        )
-                        elements.append(supplier_table)
-                        elements.append(Spacer(1, 20))
-                
-                # Add food categories table if available
-                if 'food_categories' in report_data["metrics"] and isinstance(report_data["metrics"]['food_categories'], list):
-                    elements.append(Paragraph("Food Categories", styles["Heading2"]))
-                    elements.append(Spacer(1, 10))
-                    
-                    category_data = [
-                        ["Category", "Count", "Total (kg)"]
-                    ]
-                    
-                    for category in report_data["metrics"]['food_categories']:
-                        if isinstance(category, dict):
-                            category_type = category.get('listing_type', 'Unknown')
-                            count = str(category.get('count', 0))
-                            total_kg = "{:.1f}".format(float(category.get('total_kg', 0)))
-                            category_data.append([category_type, count, total_kg])
-                    
-                    if len(category_data) > 1:  # if we have data beyond just the header
-                        category_table = Table(category_data, colWidths=[200, 150, 150])
-                        category_table.setStyle(
-                            TableStyle([
-                                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3498db")),
-                                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                                ("FONTSIZE", (0, 0), (-1, 0), 11),
-                                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                                ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#bdc3c7")),
-                                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f9f9f9")]),
-                                ("ALIGN", (1, 1), (1, -1), "RIGHT"),  # Right align count
-                                ("ALIGN", (2, 1), (2, -1), "RIGHT"),  # Right align total kg
-                            ])
-                        )
-                        elements.append(category_table)
-                        elements.append(Spacer(1, 20))
-                        
-                # Add rescued by category table if available (for waste reduction reports)
-                if 'rescued_by_category' in report_data["metrics"] and isinstance(report_data["metrics"]['rescued_by_category'], list):
-                    elements.append(Paragraph("Rescued By Category", styles["Heading2"]))
-                    elements.append(Spacer(1, 10))
-                    
-                    category_data = [
-                        ["Category", "Count", "Total (kg)"]
-                    ]
-                    
-                    for category in report_data["metrics"]['rescued_by_category']:
-                        if isinstance(category, dict):
-                            category_type = category.get('category', 'Unknown')
-                            count = str(category.get('count', 0))
-                            total_kg = "{:.1f}".format(float(category.get('total_kg', 0)))
-                            category_data.append([category_type, count, total_kg])
-                    
-                    if len(category_data) > 1:  # if we have data beyond just the header
-                        category_table = Table(category_data, colWidths=[200, 150, 150])
-                        category_table.setStyle(
-                            TableStyle([
-                                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3498db")),
-                                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                                ("FONTSIZE", (0, 0), (-1, 0), 11),
-                                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                                ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#bdc3c7")),
-                                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f9f9f9")]),
-                                ("ALIGN", (1, 1), (1, -1), "RIGHT"),  # Right align count
-                                ("ALIGN", (2, 1), (2, -1), "RIGHT"),  # Right align total kg
-                            ])
-                        )
-                        elements.append(category_table)
-                        elements.append(Spacer(1, 20))
-                
+                # Supplier and category breakdown tables
+                _append_spec_tables(elements, metrics, _LEADING_TABLES)
+
                 # Add peak rescue times if available (for waste reduction reports)
-                if 'peak_rescue_times' in report_data["metrics"] and isinstance(report_data["metrics"]['peak_rescue_times'], dict):
-                    peak_data = report_data["metrics"]['peak_rescue_times']
-                    elements.append(Paragraph("Peak Rescue Times", styles["Heading2"]))
-                    elements.append(Spacer(1, 10))
+                if isinstance(peak_data, dict):
+                    elements += (Paragraph("Peak Rescue Times", styles["Heading2"]), Spacer(1, 10))
                     
                     # Create peak summary text
                     peak_day = peak_data.get('peak_day', {})
@@ -1094,119 +1569,39 @@ class Report(BaseModel):
                             f"Peak rescue day is {peak_day.get('day_name')} with {peak_day.get('count')} rescues. "
                             f"Peak rescue hour is {peak_hour.get('formatted_hour')} with {peak_hour.get('count')} rescues."
                         )
-                        elements.append(Paragraph(peak_text, styles["Normal"]))
-                        elements.append(Spacer(1, 15))
+                        elements += (Paragraph(peak_text, styles["Normal"]), Spacer(1, 15))
                     
                     # Create rescue activity by day table
                     if 'days' in peak_data and peak_data['days']:
-                        elements.append(Paragraph("Rescue Activity by Day", styles["Heading3"]))
-                        elements.append(Spacer(1, 5))
-                        
-                        day_data = [["Day", "Rescues"]]
-                        for day in peak_data['days']:
-                            day_data.append([day.get('day_name', ''), str(day.get('count', 0))])
-                            
-                        day_table = Table(day_data, colWidths=[150, 100])
-                        day_table.setStyle(
-                            TableStyle([
-                                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3498db")),
-                                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                                ("ALIGN", (0, 0), (-1, 0), "LEFT"),
-                                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                                ("FONTSIZE", (0, 0), (-1, 0), 10),
-                                ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                                ("TOPPADDING", (0, 0), (-1, 0), 8),
-                                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                                ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#bdc3c7")),
-                                ("ALIGN", (1, 1), (1, -1), "RIGHT"),  # Right align count
-                            ])
+                        _append_table(
+                            elements,
+                            "Rescue Activity by Day",
+                            ["Day", "Rescues"],
+                            _rows(peak_data['days'], _PEAK_DAY_PDF_FIELDS),
+                            [150, 100],
+                            _pdf_table_styles()["activity"],
+                            heading="Heading3",
+                            space_before=5,
+                            space_after=15,
                         )
-                        elements.append(day_table)
-                        elements.append(Spacer(1, 15))
-                        
+
                     # Create rescue activity by hour table
                     if 'hours' in peak_data and peak_data['hours']:
-                        elements.append(Paragraph("Rescue Activity by Hour", styles["Heading3"]))
-                        elements.append(Spacer(1, 5))
-                        
-                        hour_data = [["Hour", "Rescues"]]
-                        for hour in peak_data['hours']:
-                            hour_data.append([hour.get('formatted_hour', ''), str(hour.get('count', 0))])
-                            
-                        hour_table = Table(hour_data, colWidths=[150, 100])
-                        hour_table.setStyle(
-                            TableStyle([
-                                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3498db")),
-                                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                                ("ALIGN", (0, 0), (-1, 0), "LEFT"),
-                                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                                ("FONTSIZE", (0, 0), (-1, 0), 10),
-                                ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
-                                ("TOPPADDING", (0, 0), (-1, 0), 8),
-                                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                                ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#bdc3c7")),
-                                ("ALIGN", (1, 1), (1, -1), "RIGHT"),  # Right align count
-                            ])
+                        _append_table(
+                            elements,
+                            "Rescue Activity by Hour",
+                            ["Hour", "Rescues"],
+                            _rows(peak_data['hours'], _PEAK_HOUR_PDF_FIELDS),
+                            [150, 100],
+                            _pdf_table_styles()["activity"],
+                            heading="Heading3",
+                            space_before=5,
                         )
-                        elements.append(hour_table)
-                        elements.append(Spacer(1, 20))
-                
-                # Add expiry waste report tables
-                if self.report_type == 'EXPIRY_WASTE':
-                    # Suppliers With Most Expired
-                    if 'suppliers_with_most_expired' in report_data["metrics"] and isinstance(report_data["metrics"]['suppliers_with_most_expired'], list):
-                        elements.append(Paragraph("Suppliers With Most Expired Listings", styles["Heading2"]))
-                        elements.append(Spacer(1, 10))
-                        supplier_data = [["Supplier", "Expired Count", "Food Wasted (kg)"]]
-                        for supplier in report_data["metrics"]['suppliers_with_most_expired']:
-                            supplier_data.append([
-                                supplier.get('supplier_name', ''),
-                                supplier.get('expired_count', 0),
-                                "{:.1f}".format(float(supplier.get('wasted_kg', 0)))
-                            ])
-                        if len(supplier_data) > 1:
-                            supplier_table = Table(supplier_data, colWidths=[200, 120, 120])
-                            supplier_table.setStyle(TableStyle([
-                                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e74c3c")),
-                                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                                ("FONTSIZE", (0, 0), (-1, 0), 11),
-                                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                                ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#bdc3c7")),
-                                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f9f9f9")]),
-                                ("ALIGN", (1, 1), (2, -1), "RIGHT"),
-                            ]))
-                            elements.append(supplier_table)
-                            elements.append(Spacer(1, 20))
-                    # Expired By Food Type
-                    if 'expired_by_food_type' in report_data["metrics"] and isinstance(report_data["metrics"]['expired_by_food_type'], list):
-                        elements.append(Paragraph("Expired Food By Type", styles["Heading2"]))
-                        elements.append(Spacer(1, 10))
-                        type_data = [["Food Type", "Count", "Wasted (kg)"]]
-                        for food_type in report_data["metrics"]['expired_by_food_type']:
-                            type_data.append([
-                                food_type.get('type', ''),
-                                food_type.get('count', 0),
-                                "{:.1f}".format(float(food_type.get('wasted_kg', 0)))
-                            ])
-                        if len(type_data) > 1:
-                            type_table = Table(type_data, colWidths=[200, 120, 120])
-                            type_table.setStyle(TableStyle([
-                                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e67e22")),
-                                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                                ("FONTSIZE", (0, 0), (-1, 0), 11),
-                                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                                ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#bdc3c7")),
-                                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f9f9f9")]),
-                                ("ALIGN", (1, 1), (2, -1), "RIGHT"),
-                            ]))
-                            elements.append(type_table)
-                            elements.append(Spacer(1, 20))
+
+                # Report-specific tables such as the expiry waste breakdowns
+                _append_spec_tables(
+                    elements, metrics, _TRAILING_TABLES_BY_TYPE.get(self.report_type, ())
+                )
 
             # Format the daily trends table
             if (
@@ -1214,309 +1609,183 @@ class Report(BaseModel):
                 and isinstance(report_data["daily_trends"], list)
                 and report_data["daily_trends"]
             ):
-                elements.append(Paragraph("Daily Trends", styles["Heading2"]))
-                elements.append(Spacer(1, 10))  # Add space after heading
+                elements += (Paragraph("Daily Trends", styles["Heading2"]), Spacer(1, 10))
 
-                first_day = report_data["daily_trends"][0]
+                daily_trends = report_data["daily_trends"]
+                # The first day decides the columns; work out the non-date keys once
+                columns = [k for k in daily_trends[0] if k != "date"]
                 # Format the column headers to be clearer
-                headers = ["Date"] + [
-                    k.replace("_", " ").title() for k in first_day.keys() if k != "date"
-                ]
-                table_data = [headers]
+                headers = ["Date"] + [k.replace("_", " ").title() for k in columns]
+                date_format = "%b %d, %Y"
 
-                for day in report_data["daily_trends"]:
+                def format_date(date_str):
                     try:
-                        date_str = day.get("date", "")
                         if isinstance(date_str, str):
-                            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                            formatted_date = date_obj.strftime("%b %d, %Y")
-                        else:
-                            formatted_date = str(date_str)
-
+                            return _parse_ymd(date_str).strftime(date_format)
                     except (ValueError, TypeError):
-                        formatted_date = str(date_str)
-
-                    row = [formatted_date]
-                    for key in first_day.keys():
-                        if key != "date":
-                            value = day.get(key, "")
-                            if isinstance(value, (int, float)):
-                                formatted_value = (
-                                    "{:,.2f}".format(value)
-                                    if isinstance(value, float)
-                                    else "{:,}".format(value)
-                                )
-                            else:
-                                formatted_value = str(value)
-                            row.append(formatted_value)
-                    table_data.append(row)
+                        pass
+                    return str(date_str)
+
+                # Format one column at a time, then zip the columns into rows
+                formatted_columns = [
+                    list(map(format_date, [day.get("date", "") for day in daily_trends]))
+                ]
+                formatted_columns += [
+                    list(map(_format_trend_value, [day.get(key, "") for day in daily_trends]))
+                    for key in columns
+                ]
+                table_data = [headers, *map(list, zip(*formatted_columns))]
 
                 if table_data:
-                    # Dynamically fit columns to landscape page width (letter landscape ~720pt width, minus margins)
-                    max_table_width = 700  # points, adjust as needed for margins
-                    n_cols = len(headers)
-                    min_col_width = 40
-                    max_col_width = 120
-                    base_width = max_table_width // n_cols
-                    col_widths = [max(min_col_width, min(base_width, max_col_width))] * n_cols
-                    # Shrink font size if too many columns
-                    font_size = 9 if n_cols <= 10 else 7 if n_cols <= 16 else 6
-                    table = Table(table_data, colWidths=col_widths, repeatRows=1)
-                    table.setStyle(
-                        TableStyle(
-                            [
-                                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3498db")),
-                                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                                ("FONTSIZE", (0, 0), (-1, 0), font_size+1),
-                                ("BOTTOMPADDING", (0, 0), (-1, 0), 10),
-                                ("TOPPADDING", (0, 0), (-1, 0), 10),
-                                ("BACKGROUND", (0, 1), (-1, -1), colors.white),
-                                ("TEXTCOLOR", (0, 1), (-1, -1), colors.HexColor("#2c3e50")),
-                                ("FONTNAME", (0, 1), (-1, -1), "Helvetica"),
-                                ("FONTSIZE", (0, 1), (-1, -1), font_size),
-                                ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#bdc3c7")),
-                                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f9f9f9")]),
-                                ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
-                                ("ALIGN", (0, 1), (0, -1), "LEFT"),
-                                ("LEFTPADDING", (0, 0), (-1, -1), 6),
-                                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-                            ]
-                        )
-                    )
+                    col_widths, font_size = _trends_layout(len(headers))
+                    table = Table(table_data, colWidths=list(col_widths), repeatRows=1)
+                    table.setStyle(_trends_table_style(font_size))
                     elements.append(table)
 
             # Build the PDF
             doc.build(elements)
-            pdf = buffer.getvalue()
-            buffer.close()
-
-            # Create response
-            response = HttpResponse(content_type="application/pdf")
-            response["Content-Disposition"] = (
-                f'attachment; filename="{str(self.title).replace(" ", "_")}.pdf"'
-            )
-            response.write(pdf)
-            return response
 
-        except Exception as e:
-            print(f"Error generating PDF: {str(e)}")
+        except Exception:
+            logger.exception("Error generating PDF for report %s", self.pk)
             raise
 
-    def export_as_csv(self) -> HttpResponse:
+    def export_as_csv(self) -> StreamingHttpResponse:
         """Export report as CSV"""
         import csv
-        from io import StringIO
 
-        # Create the CSV file
-        output = StringIO()
-        writer = csv.writer(output)
-
-        # Write title
-        writer.writerow([self.title])
-        writer.writerow([])  # Empty row for spacing
-
-        # Format dates
-        date_generated = timezone.localtime(self.date_generated)
-        date_range_start = timezone.localtime(
-            timezone.make_aware(
-                datetime.combine(self.date_range_start, datetime.min.time())
-            )
+        # Stream rows to the client as they are formatted rather than holding
+        # the whole CSV in memory; the writer hands each formatted line back
+        writer = csv.writer(_Echo())
+        response = StreamingHttpResponse(
+            (writer.writerow(row) for row in self._checked_csv_rows()),
+            content_type="text/csv",
         )
-        date_range_end = timezone.localtime(
-            timezone.make_aware(
-                datetime.combine(self.date_range_end, datetime.min.time())
-            )
+        sanitized_title = _UNSAFE_FILENAME_CHARS.sub("", str(self.title)).rstrip()
+        response["Content-Disposition"] = (
+            f'attachment; filename="{sanitized_title}.csv"'
         )
+        return response
+
+    def _checked_csv_rows(self):
+        """Yield the CSV rows, ending with an error row if formatting fails"""
+        # Rows are formatted while the response streams, after the 200 has
+        # been sent, so a failure has to be flagged in the file itself
+        try:
+            yield from self._csv_rows()
+        except Exception:
+            logger.exception("Error generating CSV for report %s", self.pk)
+            yield []
+            yield ["Error", "The export failed part way through; the data above is incomplete."]
+
+    def _csv_rows(self):
+        """Yield the rows of the CSV export in order"""
+        # Write title
+        yield [self.title]
+        yield []  # Empty row for spacing
 
         # Write report metadata with better formatting
-        writer.writerow(["Report Information"])
-        writer.writerow(
-            ["Report Type", dict(self.REPORT_TYPES).get(self.report_type, "Unknown")]
-        )
-        writer.writerow(
-            ["Generated Date", date_generated.strftime("%B %d, %Y at %I:%M %p")]
-        )
-        writer.writerow(
-            [
-                "Date Range",
-                f"{date_range_start.strftime('%B %d, %Y')} to {date_range_end.strftime('%B %d, %Y')}",
-            ]
-        )
-        writer.writerow(
-            [
-                "Generated By",
-                self.generated_by.get_full_name()
-                if hasattr(self.generated_by, "get_full_name")
-                else self.generated_by.email,
-            ]
-        )
-        writer.writerow([])  # Empty row for spacing
+        metadata = self._export_metadata
+        yield from [
+            ["Report Information"],
+            ["Report Type", metadata["report_type"]],
+            ["Generated Date", metadata["generated"]],
+            ["Date Range", metadata["date_range"]],
+            ["Generated By", metadata["generated_by"]],
+        ]
+        yield []  # Empty row for spacing
 
         # Write summary if available
         if self.summary:
-            writer.writerow(["Summary"])
-            writer.writerow([self.summary])
-            writer.writerow([])
+            yield ["Summary"]
+            yield [self.summary]
+            yield []
 
         # Write data sections
         report_data = self.data if isinstance(self.data, dict) else {}
 
+        metrics = report_data.get("metrics")
+        if not isinstance(metrics, dict):
+            metrics = {}
+
         # Process metrics dictionary
-        metrics_to_write = {}
-        if report_data.get("metrics") and isinstance(report_data["metrics"], dict):
-            writer.writerow(["Key Metrics"])
-            writer.writerow(["Metric", "Value"])  # Column Headers
+        if metrics:
+            yield ["Key Metrics"]
+            yield ["Metric", "Value"]  # Column Headers
             
             # Handle all simple metrics (exclude nested structures)
-            for key, value in report_data["metrics"].items():
-                skip_keys = ['top_suppliers', 'food_categories', 'rescued_by_category', 'peak_rescue_times']
-                # Add expiry waste report keys to skip
-                if self.report_type == 'EXPIRY_WASTE':
-                    skip_keys += ['suppliers_with_most_expired', 'expired_by_food_type']
-                if self.report_type == 'BENEFICIARY':
-                    skip_keys += ['nutritional_value', 'satisfaction_metrics', 'food_by_beneficiary_type']
-                if self.report_type == 'VOLUNTEER':
-                    skip_keys += ['top_volunteers', 'activity_by_day', 'volunteer_reliability']
+            skip_keys = _SKIP_KEYS_BY_TYPE.get(self.report_type, _NESTED_METRIC_KEYS)
+            for key, value in metrics.items():
                 if key in skip_keys:
                     continue
                 
                 # Format numbers with commas for thousands and limit decimal places
-                if isinstance(value, (int, float)):
-                    if value == int(value):
-                        formatted_value = f"{int(value):,}"
-                    else:
-                        formatted_value = f"{value:.1f}"
-                else:
-                    formatted_value = str(value)
+                formatted_value = _CSV_METRIC_FORMATTERS.get(type(value), str)(value)
                 
                 # Format key to be more readable
                 formatted_key = key.replace("_", " ").title()
-                writer.writerow([formatted_key, formatted_value])
+                yield [formatted_key, formatted_value]
 
-            writer.writerow([])  # Empty row for spacing
-            
-            # Format Top Suppliers table if available
-            if 'top_suppliers' in report_data["metrics"] and isinstance(report_data["metrics"]['top_suppliers'], list):
-                writer.writerow(["Top Suppliers"])
-                writer.writerow(["Supplier", "Transaction Count", "Total Food (kg)"])
-                
-                for supplier in report_data["metrics"]['top_suppliers']:
-                    if isinstance(supplier, dict):
-                        supplier_name = supplier.get('supplier_name', 'Unknown')
-                        transaction_count = supplier.get('transaction_count', 0)
-                        total_food_kg = f"{float(supplier.get('total_food_kg', 0)):.1f}"
-                        writer.writerow([supplier_name, transaction_count, total_food_kg])
-                
-                writer.writerow([])  # Empty row for spacing
+            yield []  # Empty row for spacing
             
-            # Format Food Categories table if available
-            if 'food_categories' in report_data["metrics"] and isinstance(report_data["metrics"]['food_categories'], list):
-                writer.writerow(["Food Categories"])
-                writer.writerow(["Category", "Count", "Total (kg)"])
-                
-                for category in report_data["metrics"]['food_categories']:
-                    if isinstance(category, dict):
-                        listing_type = category.get('listing_type', 'Unknown')
-                        count = category.get('count', 0)
-                        total_kg = f"{float(category.get('total_kg', 0)):.1f}"
-                        writer.writerow([listing_type, count, total_kg])
-                
-                writer.writerow([])  # Empty row for spacing
-                
-            # Format Rescued By Category table if available
-            if 'rescued_by_category' in report_data["metrics"] and isinstance(report_data["metrics"]['rescued_by_category'], list):
-                writer.writerow(["Rescued By Category"])
-                writer.writerow(["Category", "Count", "Total (kg)"])
-                
-                for category in report_data["metrics"]['rescued_by_category']:
-                    if isinstance(category, dict):
-                        category_type = category.get('category', 'Unknown')
-                        count = category.get('count', 0)
-                        total_kg = f"{float(category.get('total_kg', 0)):.1f}"
-                        writer.writerow([category_type, count, total_kg])
-                
-                writer.writerow([])  # Empty row for spacing
-                
+            # Supplier and category breakdown tables
+            yield from _csv_spec_tables(metrics, _LEADING_TABLES)
+
             # Format Peak Rescue Times if available
-            if 'peak_rescue_times' in report_data["metrics"] and isinstance(report_data["metrics"]['peak_rescue_times'], dict):
-                peak_data = report_data["metrics"]['peak_rescue_times']
-                writer.writerow(["Peak Rescue Times"])
+            if isinstance(metrics.get('peak_rescue_times'), dict):
+                peak_data = metrics['peak_rescue_times']
+                yield ["Peak Rescue Times"]
                 
                 # Write peak summary
                 peak_day = peak_data.get('peak_day', {})
                 peak_hour = peak_data.get('peak_hour', {})
                 
                 if peak_day and peak_hour:
-                    writer.writerow(["Peak Day", f"{peak_day.get('day_name', 'Unknown')} ({peak_day.get('count', 0)} rescues)"])
-                    writer.writerow(["Peak Hour", f"{peak_hour.get('formatted_hour', 'Unknown')} ({peak_hour.get('count', 0)} rescues)"])
-                    writer.writerow([])  # Empty row for spacing
+                    yield ["Peak Day", f"{peak_day.get('day_name', 'Unknown')} ({peak_day.get('count', 0)} rescues)"]
+                    yield ["Peak Hour", f"{peak_hour.get('formatted_hour', 'Unknown')} ({peak_hour.get('count', 0)} rescues)"]
+                    yield []  # Empty row for spacing
                 
                 # Write activity by day
                 if 'days' in peak_data and peak_data['days']:
-                    writer.writerow(["Rescue Activity by Day"])
-                    writer.writerow(["Day", "Rescues"])
+                    yield ["Rescue Activity by Day"]
+                    yield ["Day", "Rescues"]
                     
-                    for day in peak_data['days']:
-                        writer.writerow([day.get('day_name', 'Unknown'), day.get('count', 0)])
+                    yield from _rows(peak_data['days'], _PEAK_DAY_CSV_FIELDS)
                     
-                    writer.writerow([])  # Empty row for spacing
+                    yield []  # Empty row for spacing
                 
                 # Write activity by hour
                 if 'hours' in peak_data and peak_data['hours']:
-                    writer.writerow(["Rescue Activity by Hour"])
-                    writer.writerow(["Hour", "Rescues"])
+                    yield ["Rescue Activity by Hour"]
+                    yield ["Hour", "Rescues"]
                     
-                    for hour in peak_data['hours']:
-                        writer.writerow([hour.get('formatted_hour', 'Unknown'), hour.get('count', 0)])
+                    yield from _rows(peak_data['hours'], _PEAK_HOUR_CSV_FIELDS)
                     
-                    writer.writerow([])  # Empty row for spacing
+                    yield []  # Empty row for spacing
             
-            # Add expiry waste report tables
-            if self.report_type == 'EXPIRY_WASTE':
-                # Suppliers With Most Expired
-                if 'suppliers_with_most_expired' in report_data["metrics"] and isinstance(report_data["metrics"]['suppliers_with_most_expired'], list):
-                    writer.writerow(["Suppliers With Most Expired Listings"])
-                    writer.writerow(["Supplier", "Expired Count", "Food Wasted (kg)"])
-                    for supplier in report_data["metrics"]['suppliers_with_most_expired']:
-                        writer.writerow([
-                            supplier.get('supplier_name', ''),
-                            supplier.get('expired_count', 0),
-                            "{:.1f}".format(float(supplier.get('wasted_kg', 0)))
-                        ])
-                    writer.writerow([])
-                # Expired By Food Type
-                if 'expired_by_food_type' in report_data["metrics"] and isinstance(report_data["metrics"]['expired_by_food_type'], list):
-                    writer.writerow(["Expired Food By Type"])
-                    writer.writerow(["Food Type", "Count", "Wasted (kg)"])
-                    for food_type in report_data["metrics"]['expired_by_food_type']:
-                        writer.writerow([
-                            food_type.get('type', ''),
-                            food_type.get('count', 0),
-                            "{:.1f}".format(float(food_type.get('wasted_kg', 0)))
-                        ])
-                    writer.writerow([])
+            # Report-specific tables such as the expiry waste breakdowns
+            yield from _csv_spec_tables(
+                metrics, _TRAILING_TABLES_BY_TYPE.get(self.report_type, ())
+            )
 
         if (
             report_data.get("daily_trends")
             and isinstance(report_data["daily_trends"], list)
             and report_data["daily_trends"]
         ):
-            writer.writerow(["Daily Trends"])
+            yield ["Daily Trends"]
 
             # Write headers for trends
             first_day = report_data["daily_trends"][0]
-            headers = ["Date"] + [key.replace('_', ' ').title() for key in first_day.keys() if key != "date"]
-            writer.writerow(headers)
+            data_keys = tuple(key for key in first_day.keys() if key != "date")
+            headers = ["Date", *(key.replace('_', ' ').title() for key in data_keys)]
+            yield headers
 
-            # Write data rows
             for day in report_data["daily_trends"]:
                 # Format dates correctly
                 date_str = day.get("date", "")
                 try:
                     if isinstance(date_str, str):
-                        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+                        date_obj = _parse_ymd(date_str)
                         formatted_date = date_obj.strftime("%B %d, %Y")
                     else:
                         formatted_date = date_str
@@ -1524,102 +1793,51 @@ class Report(BaseModel):
                     formatted_date = date_str
 
                 row = [formatted_date]
-                for key in first_day.keys():
-                    if key != "date":
-                        value = day.get(key, "")
-                        if isinstance(value, float):
-                            # Format floating point numbers with 1 decimal place
-                            formatted_value = f"{value:.1f}"
-                        elif isinstance(value, int):
-                            formatted_value = f"{value:,}"
-                        else:
-                            formatted_value = value
-                        row.append(formatted_value)
+                for key in data_keys:
+                    value = day.get(key, "")
+                    if isinstance(value, float):
+                        # Format floating point numbers with 1 decimal place
+                        formatted_value = f"{value:.1f}"
+                    elif isinstance(value, int):
+                        formatted_value = _format_int(value)
+                    else:
+                        formatted_value = value
+                    row.append(formatted_value)
 
-                writer.writerow(row)
+                yield row
 
-        # Create response
-        response = HttpResponse(content_type="text/csv")
-        sanitized_title = "".join(
-            str(c) for c in str(self.title) if c.isalnum() or c in (" ", "-", "_")
-        ).rstrip()
-        response["Content-Disposition"] = (
-            f'attachment; filename="{sanitized_title}.csv"'
-        )
-        response.write(output.getvalue())
-        return response
+    @classmethod
+    def _excel_formats(cls, workbook) -> Dict[str, "xlsxwriter.format.Format"]:
+        """Register the shared Excel format specs on a workbook"""
+        return {
+            name: workbook.add_format(spec) for name, spec in cls.EXCEL_FORMATS.items()
+        }
 
     def export_as_excel(self) -> HttpResponse:
-        output = BytesIO()
-        workbook = xlsxwriter.Workbook(output)
-        worksheet = workbook.add_worksheet()
+        import xlsxwriter
 
-        # Add enhanced formats
-        title_format = workbook.add_format(
-            {
-                "bold": True,
-                "font_size": 16,
-                "font_color": "#2c3e50",
-                "align": "center",
-                "valign": "vcenter",
-                "border": 0,
-            }
-        )
-
-        header_format = workbook.add_format(
-            {
-                "bold": True,
-                "font_size": 11,
-                "bg_color": "#3498db",
-                "font_color": "white",
-                "align": "center",
-                "valign": "vcenter",
-                "border": 1,
-                "border_color": "#2980b9",
-            }
-        )
-
-        subheader_format = workbook.add_format(
-            {
-                "bold": True,
-                "font_size": 11,
-                "font_color": "#2c3e50",
-                "align": "left",
-                "valign": "vcenter",
-            }
-        )
-
-        cell_format = workbook.add_format(
-            {
-                "font_size": 10,
-                "align": "left",
-                "valign": "vcenter",
-                "border": 1,
-                "border_color": "#bdc3c7",
-            }
-        )
-
-        number_format = workbook.add_format(
+        output = BytesIO()
+        # Rows are written strictly top to bottom, so each one can be flushed
+        # as soon as it is complete instead of holding the whole sheet in RAM
+        workbook = xlsxwriter.Workbook(
+            output,
             {
-                "font_size": 10,
-                "align": "right",
-                "valign": "vcenter",
-                "border": 1,
-                "border_color": "#bdc3c7",
-                "num_format": "#,##0.00",
-            }
+                "constant_memory": True,
+                "strings_to_numbers": False,
+                "strings_to_formulas": False,
+                "strings_to_urls": False,
+            },
         )
+        worksheet = workbook.add_worksheet()
 
-        date_format = workbook.add_format(
-            {
-                "font_size": 10,
-                "align": "left",
-                "valign": "vcenter",
-                "border": 1,
-                "border_color": "#bdc3c7",
-                "num_format": "mmm d yyyy",
-            }
-        )
+        # Add enhanced formats
+        formats = self._excel_formats(workbook)
+        title_format = formats["title"]
+        header_format = formats["header"]
+        subheader_format = formats["subheader"]
+        cell_format = formats["cell"]
+        number_format = formats["number"]
+        date_format = formats["date"]
 
         # Set column widths
         worksheet.set_column("A:A", 25)  # Date/Label column
@@ -1632,17 +1850,12 @@ class Report(BaseModel):
         current_row += 2
 
         # Write report metadata
+        export_metadata = self._export_metadata
         metadata = [
-            ["Report Type:", self.get_report_type_display()],
-            ["Generated:", self.date_generated.strftime("%B %d, %Y at %I:%M %p")],
-            [
-                "Date Range:",
-                f"{self.date_range_start.strftime('%B %d, %Y')} to {self.date_range_end.strftime('%B %d, %Y')}",
-            ],
-            [
-                "Generated By:",
-                self.generated_by.get_full_name() or self.generated_by.email,
-            ],
+            ["Report Type:", export_metadata["report_type"]],
+            ["Generated:", export_metadata["generated"]],
+            ["Date Range:", export_metadata["date_range"]],
+            ["Generated By:", export_metadata["generated_by"]],
         ]
 
         for label, value in metadata:
@@ -1819,52 +2032,60 @@ class Report(BaseModel):
             current_row += 1
 
             # Write headers
-            headers = ["Date"]
             if report_data["daily_trends"]:
                 first_day = report_data["daily_trends"][0]
-                for key in first_day.keys():
-                    if key != "date":
-                        headers.append(key.replace("_", " ").title())
+                data_keys = tuple(key for key in first_day.keys() if key != "date")
+                headers = ["Date", *(key.replace("_", " ").title() for key in data_keys)]
 
-                for col, header in enumerate(headers):
-                    worksheet.write(current_row, col, header, header_format)
+                worksheet.write_row(current_row, 0, headers, header_format)
+                # Widen any trend column whose header outgrows the preset width
+                for col, header in enumerate(headers[1:], start=1):
+                    if len(header) + 2 > 15:
+                        worksheet.set_column(col, col, len(header) + 2)
 
                 current_row += 1
 
+                def write_cell(row, col, value):
+                    if isinstance(value, (int, float)):
+                        worksheet.write_number(row, col, float(value), number_format)
+                    elif value is None or value == "":
+                        # Missing trend values stay blank rather than a made-up 0
+                        worksheet.write_blank(row, col, None, cell_format)
+                    else:
+                        worksheet.write_string(row, col, str(value), cell_format)
+
                 # Write daily data
                 for day in report_data["daily_trends"]:
                     try:
                         # Handle date column
                         date_str = day.get("date", "")
-                        if isinstance(date_str, str):
-                            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+                        date_obj = (
+                            _parse_ymd(date_str) if isinstance(date_str, str) else None
+                        )
+                        values = [day.get(key) for key in data_keys]
+
+                        if date_obj is not None:
                             worksheet.write(current_row, 0, date_obj, date_format)
                         else:
                             worksheet.write(current_row, 0, str(date_str), cell_format)
 
-                        # Handle other columns
-                        col = 1
-                        for key in first_day.keys():
-                            if key != "date":
-                                value = day.get(key, "")
-                                if isinstance(value, (int, float)):
-                                    worksheet.write(
-                                        current_row, col, float(value), number_format
-                                    )
-                                else:
-                                    worksheet.write(
-                                        current_row, col, str(value), cell_format
-                                    )
-                                col += 1
+                        # Handle other columns; an all-numeric row, the usual
+                        # case, goes out in a single write_row call
+                        if all(isinstance(value, (int, float)) for value in values):
+                            worksheet.write_row(
+                                current_row,
+                                1,
+                                [float(value) for value in values],
+                                number_format,
+                            )
+                        else:
+                            for col, value in enumerate(values, start=1):
+                                write_cell(current_row, col, value)
                         current_row += 1
                     except (ValueError, TypeError) as e:
-                        print(f"Error processing day {day}: {str(e)}")
+                        logger.warning("Error processing day %s: %s", day, e)
                         continue
 
-        # Auto-adjust column widths based on content
-        for col in range(10):  # Adjust up to 10 columns
-            worksheet.autofit()
-
         workbook.close()
 
         # Create response
@@ -1872,30 +2093,89 @@ class Report(BaseModel):
             output.getvalue(),
             content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         )
-        sanitized_title = "".join(
-            c for c in str(self.title) if c.isalnum() or c in (" ", "-", "_")
-        ).rstrip()
+        sanitized_title = _UNSAFE_FILENAME_CHARS.sub("", str(self.title)).rstrip()
         response["Content-Disposition"] = (
             f'attachment; filename="{sanitized_title}.xlsx"'
         )
         return response
 
+    @classmethod
+    def _build_report_payload(
+        cls, report_type, start_date, end_date, user=None, refresh=False
+    ):
+        """Return (data, summary) for a report type without writing a report row
+
+        With refresh=True any cached payload is recomputed and replaced.
+        """
+        builder_name = cls.REPORT_BUILDERS.get(report_type)
+        if builder_name is None:
+            raise ValueError(f"Unsupported report type: {report_type}")
+        builder = getattr(cls, builder_name)
+        if report_type in cls.CACHED_REPORT_TYPES:
+            return cls._cached_report_payload(
+                report_type, start_date, end_date, builder, refresh
+            )
+        return builder(start_date, end_date, user)
+
+    @classmethod
+    def create_report(
+        cls, report_type, start_date, end_date, user, title, description=""
+    ) -> "Report":
+        """Build the payload for any report type and save it as a new report"""
+        report_data, summary = cls._build_report_payload(
+            report_type, start_date, end_date, user
+        )
+        return cls.objects.create(
+            title=title,
+            description=description,
+            report_type=report_type,
+            date_range_start=start_date,
+            date_range_end=end_date,
+            generated_by=user,
+            data=report_data,
+            summary=summary,
+        )
+
+    @classmethod
+    def _cached_report_payload(
+        cls, report_type, start_date, end_date, compute, refresh=False
+    ):
+        """Return (data, summary) for a report, caching windows that lie fully in the past"""
+        # Figures for today can still change, so only closed windows are cached
+        if end_date >= timezone.localdate():
+            return compute(start_date, end_date)
+        cache_key = f"report_payload:{report_type}:{start_date}:{end_date}"
+        if refresh:
+            # Recompute and replace whatever is cached for this window
+            payload = compute(start_date, end_date)
+            caches["analytics"].set(cache_key, payload, cls.REPORT_PAYLOAD_CACHE_TIMEOUT)
+            return payload
+        return caches["analytics"].get_or_set(
+            cache_key,
+            lambda: compute(start_date, end_date),
+            cls.REPORT_PAYLOAD_CACHE_TIMEOUT,
+        )
+
     @classmethod
     def generate_impact_report(cls, start_date, end_date, user, title=None):
         """Generate impact report for the specified date range"""
-        metrics = ImpactMetrics.objects.filter(
-            date__range=[start_date, end_date]
-        ).aggregate(
-            total_food=Sum("food_redistributed_kg"),
-            total_co2=Sum("co2_emissions_saved"),
-            total_meals=Sum("meals_provided"),
-            total_value=Sum("monetary_value_saved"),
+        report_data, summary = cls._build_report_payload(
+            "IMPACT", start_date, end_date, user
         )
 
-        # Ensure metrics are not None
-        for key in metrics:
-            metrics[key] = float(metrics[key] if metrics[key] is not None else 0)
+        return cls.objects.create(
+            title=title or f"Impact Report {start_date} to {end_date}",
+            report_type="IMPACT",
+            date_range_start=start_date,
+            date_range_end=end_date,
+            generated_by=user,
+            data=report_data,
+            summary=summary,
+        )
 
+    @classmethod
+    def _compute_impact_report(cls, start_date, end_date, user=None):
+        """Build the impact report data and summary"""
         # Get the daily metrics cleaned and properly formatted
         daily_metrics = list(
             ImpactMetrics.objects.filter(date__range=[start_date, end_date])
@@ -1907,19 +2187,28 @@ class Report(BaseModel):
                 value=Sum("monetary_value_saved"),
             )
             .order_by("date")
+            .values_list("date", "food", "co2", "meals", "value")
         )
 
+        # Range totals are the sum of the daily groups, so no second query is needed
+        metrics = {
+            "total_food": float(sum(row[1] or 0 for row in daily_metrics)),
+            "total_co2": float(sum(row[2] or 0 for row in daily_metrics)),
+            "total_meals": float(sum(row[3] or 0 for row in daily_metrics)),
+            "total_value": float(sum(row[4] or 0 for row in daily_metrics)),
+        }
+
         # Initialize empty metrics from the database
-        formatted_daily_metrics = []
-        for metric in daily_metrics:
-            formatted_metric = {
-                "date": metric["date"].strftime("%Y-%m-%d"),
-                "food_saved": float(metric["food"] or 0),
-                "co2_saved": float(metric["co2"] or 0),
-                "meals_provided": int(metric["meals"] or 0),
-                "value_saved": float(metric["value"] or 0),
+        formatted_daily_metrics = [
+            {
+                "date": day.isoformat(),
+                "food_saved": float(food or 0),
+                "co2_saved": float(co2 or 0),
+                "meals_provided": int(meals or 0),
+                "value_saved": float(value or 0),
             }
-            formatted_daily_metrics.append(formatted_metric)
+            for day, food, co2, meals, value in daily_metrics
+        ]
 
         # If no daily metrics generated
         if not formatted_daily_metrics:
@@ -1936,73 +2225,101 @@ class Report(BaseModel):
         # Enforce good data structure
         report_data = {"summary": metrics, "daily_trends": formatted_daily_metrics}
 
+        summary = f"Total food redistributed: {metrics['total_food']:.1f}kg, CO2 saved: {metrics['total_co2']:.1f}kg, Meals provided: {int(metrics['total_meals'])}, Value saved: ${metrics['total_value']:.2f}"
+
+        return report_data, summary
+
+    @classmethod
+    def generate_transaction_report(cls, start_date, end_date, user, title=None):
+        """Generate transaction report for the specified date range"""
+        report_data, summary = cls._build_report_payload(
+            "TRANSACTION", start_date, end_date, user
+        )
+
         return cls.objects.create(
-            title=title or f"Impact Report {start_date} to {end_date}",
-            report_type="IMPACT",
+            title=title or f"Transaction Report {start_date} to {end_date}",
+            report_type="TRANSACTION",
             date_range_start=start_date,
             date_range_end=end_date,
             generated_by=user,
             data=report_data,
-            summary=f"Total food redistributed: {metrics['total_food']:.1f}kg, CO2 saved: {metrics['total_co2']:.1f}kg, Meals provided: {int(metrics['total_meals'])}, Value saved: ${metrics['total_value']:.2f}",
+            summary=summary,
         )
 
     @classmethod
-    def generate_transaction_report(cls, start_date, end_date, user, title=None):
-        """Generate transaction report for the specified date range"""
+    def _compute_transaction_report(cls, start_date, end_date, user=None):
+        """Build the transaction report data and summary"""
         transactions = Transaction.objects.filter(
             transaction_date__date__range=[start_date, end_date]
         )
 
+        # Every count and the value total come out of a single aggregate query
+        status_choices = Transaction.TransactionStatus.choices
+        counts = transactions.aggregate(
+            total_count=Count("id"),
+            total_value=Sum("request__listing__price"),
+            completed_count=Count("id", filter=Q(status="COMPLETED")),
+            **{
+                f"status_{status_code}": Count("id", filter=Q(status=status_code))
+                for status_code, _ in status_choices
+            },
+        )
+
         # Use only the info that can be used with transactions
         metrics = {
-            "total_count": transactions.count(),
-            "completed_count": transactions.filter(status="COMPLETED").count(),
-            "total_value": 0,  # Will count below
+            "total_count": counts["total_count"],
+            "completed_count": counts["completed_count"],
+            "total_value": float(counts["total_value"] or 0),
         }
 
-        # Calculate total counts to avoid SQLite issues
-        total_value = 0
-        for transaction in transactions:
-            if (
-                transaction.request
-                and transaction.request.listing
-                and transaction.request.listing.price
-            ):
-                total_value += float(transaction.request.listing.price)
-        metrics["total_value"] = total_value
-
         # Here we will get the status counts
-        status_counts = {}
-        for status_code, status_label in Transaction.TransactionStatus.choices:
-            status_counts[status_code] = transactions.filter(status=status_code).count()
+        status_counts = {
+            status_code: counts[f"status_{status_code}"]
+            for status_code, _ in status_choices
+        }
 
         # Build the summary of the transaction
         summary = f"Total transactions: {metrics['total_count']}, Completed: {metrics['completed_count']}, Total value: ${metrics['total_value'] or 0}"
 
+        report_data = {
+            "metrics": metrics,
+            "status_breakdown": status_counts,
+        }
+
+        return report_data, summary
+
+    @classmethod
+    def generate_user_activity_report(cls, start_date, end_date, user, title=None):
+        """Generate user activity report for the specified date range"""
+        report_data, summary = cls._build_report_payload(
+            "USER_ACTIVITY", start_date, end_date, user
+        )
+
         return cls.objects.create(
-            title=title or f"Transaction Report {start_date} to {end_date}",
-            report_type="TRANSACTION",
+            title=title or f"User Activity Report {start_date} to {end_date}",
+            report_type="USER_ACTIVITY",
             date_range_start=start_date,
             date_range_end=end_date,
             generated_by=user,
-            data={
-                "metrics": metrics,
-                "status_breakdown": status_counts,
-            },
+            data=report_data,
             summary=summary,
         )
 
     @classmethod
-    def generate_user_activity_report(cls, start_date, end_date, user, title=None):
-        """Generate user activity report for the specified date range"""
+    def _compute_user_activity_report(cls, start_date, end_date, user=None):
+        """Build the user activity report data and summary"""
         User = get_user_model()
         activities = UserActivityLog.objects.filter(
             timestamp__date__range=[start_date, end_date]
         )
 
+        totals = activities.aggregate(
+            total=Count("id"), unique_users=Count("user", distinct=True)
+        )
+
         metrics = {
-            "total_activities": activities.count(),
-            "unique_users": activities.values("user").distinct().count(),
+            "total_activities": totals["total"],
+            "unique_users": totals["unique_users"],
             "activity_types": list(
                 activities.values("activity_type")
                 .annotate(count=Count("id"))
@@ -2015,21 +2332,32 @@ class Report(BaseModel):
             ),
         }
 
-        return cls.objects.create(
-            title=title or f"User Activity Report {start_date} to {end_date}",
-            report_type="USER_ACTIVITY",
+        summary = f"Total activities: {metrics['total_activities']}, Unique users: {metrics['unique_users']}"
+
+        return metrics, summary
+
+    @classmethod
+    def generate_compliance_report(
+        cls, start_date, end_date, user, title: Optional[str] = None
+    ) -> "Report":
+        """Generate compliance report for the specified date range"""
+        report_data, summary = cls._build_report_payload(
+            "COMPLIANCE", start_date, end_date, user
+        )
+
+        return cls.objects.create(
+            title=title or f"Compliance Report {start_date} to {end_date}",
+            report_type="COMPLIANCE",
             date_range_start=start_date,
             date_range_end=end_date,
             generated_by=user,
-            data=metrics,
-            summary=f"Total activities: {metrics['total_activities']}, Unique users: {metrics['unique_users']}",
+            data=report_data,
+            summary=summary,
         )
 
     @classmethod
-    def generate_compliance_report(
-        cls, start_date, end_date, user, title: Optional[str] = None
-    ) -> "Report":
-        """Generate compliance report for the specified date range"""
+    def _compute_compliance_report(cls, start_date, end_date, user=None):
+        """Build the compliance report data and summary"""
         compliance_metrics: Dict[str, Union[int, float]] = {
             "total_listings": 0,
             "total_checks": 0,
@@ -2045,36 +2373,60 @@ class Report(BaseModel):
                 created_at__date__range=[start_date, end_date]
             )
 
-            if listings.exists():
-                compliance_metrics["total_listings"] = listings.count()
+            listing_ids = list(listings.values_list("id", flat=True))
 
-                for listing in listings:
-                    try:
-                        check, created = ComplianceCheck.objects.get_or_create(
-                            listing=listing,
+            if listing_ids:
+                compliance_metrics["total_listings"] = len(listing_ids)
+
+                # Create the missing checks in one batch instead of a
+                # get_or_create round trip per listing
+                checked_ids = set(
+                    ComplianceCheck.objects.filter(listing__in=listings).values_list(
+                        "listing_id", flat=True
+                    )
+                )
+                new_checks = [
+                    ComplianceCheck(
+                        listing_id=listing_id,
+                        checked_by=user,
+                        is_compliant=True,
+                        notes="Auto-generated during report creation",
+                    )
+                    for listing_id in listing_ids
+                    if listing_id not in checked_ids
+                ]
+                try:
+                    with transaction.atomic():
+                        ComplianceCheck.objects.bulk_create(new_checks)
+                    created = len(new_checks)
+                except IntegrityError:
+                    # Another run created some of these checks in the meantime;
+                    # fall back to one get_or_create per listing so only the
+                    # checks actually inserted here are counted
+                    created = 0
+                    for check in new_checks:
+                        _, was_created = ComplianceCheck.objects.get_or_create(
+                            listing_id=check.listing_id,
                             defaults={
-                                "checked_by": user,
-                                "is_compliant": True,
-                                "notes": "Auto-generated during report creation",
+                                "checked_by": check.checked_by,
+                                "is_compliant": check.is_compliant,
+                                "notes": check.notes,
                             },
                         )
-
-                        compliance_metrics["total_checks"] += 1
-                        if created:
-                            compliance_metrics["compliance_checks_created"] += 1
-
-                        if check.is_compliant:
-                            compliance_metrics["passed"] += 1
-                        else:
-                            compliance_metrics["failed"] += 1
-                    except (
-                        DBError,
-                        ObjectDoesNotExist,
-                        AttributeError,
-                        ValueError,
-                    ):
-                        # Handle the error here
-                        continue
+                        created += was_created
+                compliance_metrics["compliance_checks_created"] = created
+
+                check_counts = ComplianceCheck.objects.filter(
+                    listing__in=listings
+                ).aggregate(
+                    total=Count("id"),
+                    passed=Count("id", filter=Q(is_compliant=True)),
+                )
+                compliance_metrics["total_checks"] = check_counts["total"]
+                compliance_metrics["passed"] = check_counts["passed"]
+                compliance_metrics["failed"] = (
+                    check_counts["total"] - check_counts["passed"]
+                )
 
                 if compliance_metrics["total_checks"] > 0:
                     compliance_metrics["compliance_rate"] = float(
@@ -2095,19 +2447,28 @@ class Report(BaseModel):
             f"New Compliance Checks: {compliance_metrics['compliance_checks_created']}"
         )
 
+        return compliance_metrics, summary
+
+    @classmethod
+    def generate_system_performance_report(cls, start_date, end_date, user, title=None):
+        """Generate system performance report for the specified date range"""
+        report_data, summary = cls._build_report_payload(
+            "SYSTEM", start_date, end_date, user
+        )
+
         return cls.objects.create(
-            title=title or f"Compliance Report {start_date} to {end_date}",
-            report_type="COMPLIANCE",
+            title=title or f"System Performance Report {start_date} to {end_date}",
+            report_type="SYSTEM",
             date_range_start=start_date,
             date_range_end=end_date,
             generated_by=user,
-            data=compliance_metrics,
+            data=report_data,
             summary=summary,
         )
 
     @classmethod
-    def generate_system_performance_report(cls, start_date, end_date, user, title=None):
-        """Generate system performance report for the specified date range"""
+    def _compute_system_performance_report(cls, start_date, end_date):
+        """Build the system performance report data and summary"""
         # Get aggregate system metrics
         metrics = SystemMetrics.objects.filter(
             date__range=[start_date, end_date]
@@ -2137,15 +2498,15 @@ class Report(BaseModel):
         )
 
         # Initialize empty metrics after database entries
-        formatted_daily_metrics = []
-        for metric in daily_metrics:
-            formatted_metric = {
+        formatted_daily_metrics = [
+            {
                 "date": metric["date"].strftime("%Y-%m-%d"),
                 "active_users": int(metric["active_users"] or 0),
                 "response_time": float(metric["response_time"] or 0),
                 "completion_rate": float(metric["completion_rate"] or 0),
             }
-            formatted_daily_metrics.append(formatted_metric)
+            for metric in daily_metrics
+        ]
 
         # If we have no entries in daily metrics then we add an empty one
         if not formatted_daily_metrics:
@@ -2183,53 +2544,63 @@ class Report(BaseModel):
             },
         }
 
+        summary = f"Avg completion rate: {metrics['avg_transaction_completion']:.1f}%, Response time: {metrics['avg_response_time']:.2f} hours, Active users: {metrics['total_active_users']}"
+
+        return report_data, summary
+
+    @classmethod
+    def generate_supplier_performance_report(cls, start_date, end_date, user, title=None):
+        """Generate supplier performance report for the specified date range"""
+        report_data, summary = cls._build_report_payload(
+            "SUPPLIER", start_date, end_date, user
+        )
+
         return cls.objects.create(
-            title=title or f"System Performance Report {start_date} to {end_date}",
-            report_type="SYSTEM",
+            title=title or f"Supplier Performance Report {start_date} to {end_date}",
+            report_type="SUPPLIER",
             date_range_start=start_date,
             date_range_end=end_date,
             generated_by=user,
             data=report_data,
-            summary=f"Avg completion rate: {metrics['avg_transaction_completion']:.1f}%, Response time: {metrics['avg_response_time']:.2f} hours, Active users: {metrics['total_active_users']}",
+            summary=summary
         )
 
     @classmethod
-    def generate_supplier_performance_report(cls, start_date, end_date, user, title=None):
-        """Generate supplier performance report for the specified date range"""
-        
-        # Get supplier data from transactions
-        User = get_user_model()
-        suppliers = User.objects.filter(
-            user_type="BUSINESS",
-            food_listings__created_at__date__range=[start_date, end_date]
-        ).distinct()
+    def _compute_supplier_performance_report(cls, start_date, end_date, user=None):
+        """Build the supplier performance report data and summary"""
         
+        # Process suppliers' transaction data
+        supplier_transactions = Transaction.objects.filter(
+            request__listing__supplier_user_type="BUSINESS",
+            transaction_date__date__range=[start_date, end_date]
+        )
+
         # Calculate key metrics
-        supplier_reliability = calculate_supplier_reliability(start_date, end_date)
+        supplier_reliability = calculate_supplier_reliability(
+            start_date, end_date, transactions=supplier_transactions
+        )
         supplier_growth = calculate_supplier_growth(start_date, end_date)
-        top_suppliers = get_top_suppliers(start_date, end_date)
-        food_categories = get_food_categories_by_supplier(start_date, end_date)
+        top_suppliers = get_top_suppliers(
+            start_date, end_date, transactions=supplier_transactions
+        )
+        food_categories = get_food_categories_by_supplier(
+            start_date, end_date, transactions=supplier_transactions
+        )
         avg_quality_rating = calculate_avg_quality_rating_by_supplier(start_date, end_date)
         on_time_delivery = get_delivery_performance(start_date, end_date)
         
-        # Process suppliers' transaction data
-        supplier_transactions = Transaction.objects.filter(
-            request__listing__supplier__user_type="BUSINESS",
-            transaction_date__date__range=[start_date, end_date]
+        # Volume and active supplier count share a single pass over the rows
+        supplier_totals = supplier_transactions.aggregate(
+            total_kg=Sum('request__quantity_requested', filter=Q(status="COMPLETED")),
+            active_suppliers=Count(
+                'request__listing__supplier', filter=Q(status="COMPLETED"), distinct=True
+            ),
         )
-        
-        total_food_volume = supplier_transactions.filter(
-            status="COMPLETED"
-        ).aggregate(
-            total_kg=Sum('request__quantity_requested')
-        )['total_kg'] or 0
+        total_food_volume = supplier_totals['total_kg'] or 0
         
         # Get daily metrics for trends
-        daily_metrics = list(
-            Transaction.objects.filter(
-                request__listing__supplier__user_type="BUSINESS",
-                transaction_date__date__range=[start_date, end_date]
-            ).annotate(date=TruncDay('transaction_date'))
+        daily_metrics = (
+            supplier_transactions.annotate(date=TruncDay('transaction_date'))
             .values('date')
             .annotate(
                 daily_volume=Sum('request__quantity_requested', filter=Q(status="COMPLETED")),
@@ -2239,19 +2610,19 @@ class Report(BaseModel):
         )
         
         # Format daily metrics
-        formatted_daily_metrics = []
-        for metric in daily_metrics:
-            success_rate = 0
-            if metric['daily_transactions'] > 0:
-                success_rate = (metric['completed_transactions'] / metric['daily_transactions']) * 100
-                
-            formatted_metric = {
+        formatted_daily_metrics = [
+            {
                 'date': metric['date'].strftime('%Y-%m-%d'),
                 'food_volume': float(metric['daily_volume'] or 0),
                 'transactions': metric['daily_transactions'],
-                'success_rate': float(success_rate),
+                'success_rate': (
+                    metric['completed_transactions'] * 100.0 / metric['daily_transactions']
+                    if metric['daily_transactions']
+                    else 0.0
+                ),
             }
-            formatted_daily_metrics.append(formatted_metric)
+            for metric in daily_metrics.iterator(chunk_size=500)
+        ]
         
         # If no data, provide empty placeholder
         if not formatted_daily_metrics:
@@ -2264,13 +2635,13 @@ class Report(BaseModel):
         
         # Compile all metrics
         metrics = {
-            "total_suppliers": suppliers.count(),
+            # Distinct business suppliers that listed food in the date range
+            "total_suppliers": FoodListing.objects.filter(
+                supplier_user_type="BUSINESS",
+                created_at__date__range=[start_date, end_date],
+            ).aggregate(count=Count("supplier", distinct=True))["count"],
             # Count distinct suppliers with completed transactions in the date range
-            "active_suppliers": Transaction.objects.filter(
-                request__listing__supplier__user_type="BUSINESS",
-                transaction_date__date__range=[start_date, end_date],
-                status="COMPLETED",
-            ).values("request__listing__supplier").distinct().count(),
+            "active_suppliers": supplier_totals['active_suppliers'],
             "total_food_volume": float(total_food_volume),
             "supplier_reliability": float(supplier_reliability),
             "supplier_growth": float(supplier_growth),
@@ -2285,9 +2656,6 @@ class Report(BaseModel):
             "metrics": metrics,
             "daily_trends": formatted_daily_metrics
         }
-        # Normalize data to valid JSON by round-tripping through json
-        import json
-        report_data = json.loads(json.dumps(report_data))
         
         # Create summary text
         summary = (
@@ -2296,10 +2664,19 @@ class Report(BaseModel):
             f"Avg reliability: {metrics['supplier_reliability']:.1f}%, "
             f"Quality rating: {metrics['avg_quality_rating']:.1f}/5"
         )
-        
+
+        return report_data, summary
+
+    @classmethod
+    def generate_waste_reduction_report(cls, start_date, end_date, user, title=None):
+        """Generate food waste reduction report for the specified date range"""
+        report_data, summary = cls._build_report_payload(
+            "WASTE_REDUCTION", start_date, end_date, user
+        )
+
         return cls.objects.create(
-            title=title or f"Supplier Performance Report {start_date} to {end_date}",
-            report_type="SUPPLIER",
+            title=title or f"Food Waste Reduction Report {start_date} to {end_date}",
+            report_type="WASTE_REDUCTION",
             date_range_start=start_date,
             date_range_end=end_date,
             generated_by=user,
@@ -2308,8 +2685,8 @@ class Report(BaseModel):
         )
 
     @classmethod
-    def generate_waste_reduction_report(cls, start_date, end_date, user, title=None):
-        """Generate food waste reduction report for the specified date range"""
+    def _compute_waste_reduction_report(cls, start_date, end_date, user=None):
+        """Build the food waste reduction report data and summary"""
         
         # Get listings that were successfully rescued (completed transactions)
         rescued_listings = Transaction.objects.filter(
@@ -2317,10 +2694,12 @@ class Report(BaseModel):
             completion_date__date__range=[start_date, end_date]
         )
         
-        # Calculate total food rescued
-        total_food_rescued = rescued_listings.aggregate(
-            total_kg=Sum('request__quantity_requested')
-        )['total_kg'] or 0
+        # Calculate total food rescued and the rescue count in one query
+        rescue_totals = rescued_listings.aggregate(
+            total_kg=Sum('request__quantity_requested'),
+            total_count=Count('id'),
+        )
+        total_food_rescued = rescue_totals['total_kg'] or 0
         
         # Calculate average time to rescue
         avg_rescue_time = calculate_avg_rescue_time(start_date, end_date)
@@ -2342,7 +2721,7 @@ class Report(BaseModel):
         metrics = {
             "total_food_rescued_kg": float(total_food_rescued),
             "avg_time_to_rescue_hours": float(avg_rescue_time),
-            "total_successful_rescues": rescued_listings.count(),
+            "total_successful_rescues": rescue_totals['total_count'],
             "economic_value_saved": float(economic_value),
             "co2_saved_kg": float(co2_saved),
             "rescued_by_category": rescued_by_category,
@@ -2362,20 +2741,29 @@ class Report(BaseModel):
             f"Economic value: ${metrics['economic_value_saved']:.2f}, "
             f"Avg rescue time: {metrics['avg_time_to_rescue_hours']:.1f} hours"
         )
-        
+
+        return report_data, summary
+
+    @classmethod
+    def generate_beneficiary_impact_report(cls, start_date, end_date, user, title=None):
+        """Generate beneficiary impact report for the specified date range"""
+        report_data, summary = cls._build_report_payload(
+            "BENEFICIARY", start_date, end_date, user
+        )
+
         return cls.objects.create(
-            title=title or f"Food Waste Reduction Report {start_date} to {end_date}",
-            report_type="WASTE_REDUCTION",
+            title=title or f"Beneficiary Impact Report {start_date} to {end_date}",
+            report_type="BENEFICIARY",
             date_range_start=start_date,
             date_range_end=end_date,
             generated_by=user,
             data=report_data,
-            summary=summary
+            summary=summary,
         )
 
     @classmethod
-    def generate_beneficiary_impact_report(cls, start_date, end_date, user, title=None):
-        """Generate beneficiary impact report for the specified date range"""
+    def _compute_beneficiary_impact_report(cls, start_date, end_date, user=None):
+        """Build the beneficiary impact report data and summary"""
         
         # Get recipient/nonprofit data
         User = get_user_model()
@@ -2410,14 +2798,15 @@ class Report(BaseModel):
         ).order_by('date')
         
         # Format daily trends
-        trends = []
-        for day in daily_data:
-            trends.append({
+        trends = [
+            {
                 'date': day['date'].strftime('%Y-%m-%d'),
                 'food_received': float(day['food_received'] or 0),
                 'transaction_count': day['transaction_count'],
                 'beneficiaries_count': day['beneficiaries_count']
-            })
+            }
+            for day in daily_data
+        ]
         
         # If no data, provide an empty placeholder
         if not trends:
@@ -2441,19 +2830,28 @@ class Report(BaseModel):
             f"Cost savings: ${metrics['cost_savings']:.2f}"
         )
         
+        return report_data, summary
+
+    @classmethod
+    def generate_volunteer_performance_report(cls, start_date, end_date, user, title=None):
+        """Generate volunteer performance report for the specified date range"""
+        report_data, summary = cls._build_report_payload(
+            "VOLUNTEER", start_date, end_date, user
+        )
+
         return cls.objects.create(
-            title=title or f"Beneficiary Impact Report {start_date} to {end_date}",
-            report_type="BENEFICIARY",
+            title=title or f"Volunteer Performance Report {start_date} to {end_date}",
+            report_type="VOLUNTEER",
             date_range_start=start_date,
             date_range_end=end_date,
             generated_by=user,
             data=report_data,
-            summary=summary
+            summary=summary,
         )
 
     @classmethod
-    def generate_volunteer_performance_report(cls, start_date, end_date, user, title=None):
-        """Generate volunteer performance report for the specified date range"""
+    def _compute_volunteer_performance_report(cls, start_date, end_date, user=None):
+        """Build the volunteer performance report data and summary"""
         # Get User model for volunteer data
         User = get_user_model()
         
@@ -2498,9 +2896,11 @@ class Report(BaseModel):
             total_hours = 0
             count = 0
             
-            for delivery in completed_with_times:
-                if delivery.assigned_at and delivery.delivered_at:
-                    time_diff = (delivery.delivered_at - delivery.assigned_at).total_seconds() / 3600
+            for assigned_at, delivered_at in completed_with_times.values_list(
+                'assigned_at', 'delivered_at'
+            ).iterator(chunk_size=2000):
+                if assigned_at and delivered_at:
+                    time_diff = (delivered_at - assigned_at).total_seconds() / 3600
                     
                     # Include only reasonable values (avoid negative or extreme outliers)
                     if 0 <= time_diff <= 24:  # Limit to 24 hours to avoid outliers
@@ -2564,19 +2964,28 @@ class Report(BaseModel):
             f"On-time rate: {metrics['on_time_delivery_rate']:.1f}%"
         )
         
+        return report_data, summary
+
+    @classmethod
+    def generate_expiry_waste_report(cls, start_date, end_date, user, title=None):
+        """Generate listing expiry and food waste report for the specified date range"""
+        report_data, summary = cls._build_report_payload(
+            "EXPIRY_WASTE", start_date, end_date, user
+        )
+
         return cls.objects.create(
-            title=title or f"Volunteer Performance Report {start_date} to {end_date}",
-            report_type="VOLUNTEER",
+            title=title or f"Listing Expiry & Food Waste Report {start_date} to {end_date}",
+            report_type="EXPIRY_WASTE",
             date_range_start=start_date,
             date_range_end=end_date,
             generated_by=user,
             data=report_data,
-            summary=summary
+            summary=summary,
         )
 
     @classmethod
-    def generate_expiry_waste_report(cls, start_date, end_date, user, title=None):
-        """Generate listing expiry and food waste report for the specified date range"""
+    def _compute_expiry_waste_report(cls, start_date, end_date, user=None):
+        """Build the expiry waste report data and summary"""
         
         # Get all expired listings in the date range - listings that reached their expiry date
         expired_listings = FoodListing.objects.filter(
@@ -2620,9 +3029,11 @@ class Report(BaseModel):
         total_hours_to_expiry = 0
         count_with_valid_times = 0
         
-        for listing in expired_listings:
-            if listing.created_at and listing.expiry_date:
-                hours_diff = (listing.expiry_date - listing.created_at).total_seconds() / 3600
+        for created_at, expiry_date in expired_listings.values_list(
+            'created_at', 'expiry_date'
+        ).iterator(chunk_size=2000):
+            if created_at and expiry_date:
+                hours_diff = (expiry_date - created_at).total_seconds() / 3600
                 if 0 < hours_diff < 720:  # Filter outliers (greater than 30 days)
                     total_hours_to_expiry += hours_diff
                     count_with_valid_times += 1
@@ -2675,13 +3086,14 @@ class Report(BaseModel):
         ).order_by('-count')
         
         # Format food types data
-        expired_by_type = []
-        for food_type in food_types_expired:
-            expired_by_type.append({
+        expired_by_type = [
+            {
                 'type': food_type['listing_type'],
                 'count': food_type['count'],
                 'wasted_kg': float(food_type['total_kg'] or 0)
-            })
+            }
+            for food_type in food_types_expired
+        ]
         
         # Get daily expired and rescued food trends
         daily_expiry_data = []
@@ -2740,19 +3152,28 @@ class Report(BaseModel):
             f"Avg time to expiry: {avg_time_to_expiry:.1f} hours"
         )
         
+        return report_data, summary
+
+    @classmethod
+    def generate_user_retention_churn_report(cls, start_date, end_date, user, title=None):
+        """Generate user retention and churn report for the specified date range"""
+        report_data, summary = cls._build_report_payload(
+            "USER_RETENTION", start_date, end_date, user
+        )
+
         return cls.objects.create(
-            title=title or f"Listing Expiry & Food Waste Report {start_date} to {end_date}",
-            report_type="EXPIRY_WASTE",
+            title=title or f"User Retention & Churn Report {start_date} to {end_date}",
+            report_type="USER_RETENTION",
             date_range_start=start_date,
             date_range_end=end_date,
             generated_by=user,
             data=report_data,
-            summary=summary
+            summary=summary,
         )
 
     @classmethod
-    def generate_user_retention_churn_report(cls, start_date, end_date, user, title=None):
-        """Generate user retention and churn report for the specified date range"""
+    def _compute_user_retention_churn_report(cls, start_date, end_date, user=None):
+        """Build the user retention and churn report data and summary"""
         User = get_user_model()
         # Calculate new signups vs returning users
         new_signups = User.objects.filter(
@@ -2806,77 +3227,71 @@ class Report(BaseModel):
             f"30-day retention: {retention_data['thirty_day_retention']:.1f}%, "
             f"Churn rate: {churn_data['churn_rate']:.1f}%"
         )
-        return cls.objects.create(
-            title=title or f"User Retention & Churn Report {start_date} to {end_date}",
-            report_type="USER_RETENTION",
-            date_range_start=start_date,
-            date_range_end=end_date,
-            generated_by=user,
-            data=report_data,
-            summary=summary
-        )
+        return report_data, summary
 
 
-def calculate_supplier_reliability(start_date, end_date):
-    """Calculate supplier reliability as percentage of successful transactions"""
-    suppliers_data = Transaction.objects.filter(
-        request__listing__supplier__user_type="BUSINESS",
-        transaction_date__date__range=[start_date, end_date]
-    ).values('request__listing__supplier').annotate(
+# Display labels for report types, built once rather than per export
+_REPORT_TYPE_MAP = dict(Report.REPORT_TYPES)
+
+
+def calculate_supplier_reliability(start_date, end_date, transactions=None):
+    """Calculate supplier reliability as percentage of successful transactions
+
+    ``transactions`` may be passed to reuse an already-filtered queryset of
+    supplier transactions for the same date range.
+    """
+    if transactions is None:
+        transactions = Transaction.objects.filter(
+            request__listing__supplier_user_type="BUSINESS",
+            transaction_date__date__range=[start_date, end_date]
+        )
+    totals = transactions.aggregate(
         total_transactions=Count('id'),
         completed_transactions=Count('id', filter=Q(status="COMPLETED"))
     )
     
-    if not suppliers_data:
-        return 0.0
-    
     # Calculate overall reliability across all suppliers
-    total_transactions = sum(data['total_transactions'] for data in suppliers_data)
-    completed_transactions = sum(data['completed_transactions'] for data in suppliers_data)
-    
-    if total_transactions == 0:
+    if totals['total_transactions'] == 0:
         return 0.0
     
-    return (completed_transactions / total_transactions) * 100
+    return (totals['completed_transactions'] / totals['total_transactions']) * 100
 
 
-def get_top_suppliers(start_date, end_date, limit=5):
-    """Get top suppliers by transaction volume"""
-    suppliers = Transaction.objects.filter(
-        request__listing__supplier__user_type="BUSINESS",
-        transaction_date__date__range=[start_date, end_date],
-        status="COMPLETED"
-    ).values(
-        'request__listing__supplier__id',
-        'request__listing__supplier__email',
-        'request__listing__supplier__first_name',
-        'request__listing__supplier__last_name'
+def get_top_suppliers(start_date, end_date, limit=5, transactions=None):
+    """Get top suppliers by transaction volume
+
+    ``transactions`` may be passed to reuse an already-filtered queryset of
+    supplier transactions for the same date range.
+    """
+    if transactions is None:
+        transactions = Transaction.objects.filter(
+            request__listing__supplier_user_type="BUSINESS",
+            transaction_date__date__range=[start_date, end_date]
+        )
+    # Build the display name in SQL: full name when both parts are set, otherwise email
+    suppliers = transactions.filter(status="COMPLETED").values(
+        supplier_id=F('request__listing__supplier__id'),
+        supplier_name=Case(
+            When(
+                ~Q(request__listing__supplier__first_name="")
+                & ~Q(request__listing__supplier__last_name=""),
+                then=Concat(
+                    'request__listing__supplier__first_name',
+                    Value(' '),
+                    'request__listing__supplier__last_name',
+                ),
+            ),
+            default=F('request__listing__supplier__email'),
+            output_field=models.CharField(),
+        ),
     ).annotate(
         transaction_count=Count('id'),
-        total_food_kg=Sum('request__quantity_requested')
+        total_food_kg=Coalesce(
+            Cast(Sum('request__quantity_requested'), models.FloatField()), Value(0.0)
+        ),
     ).order_by('-transaction_count')[:limit]
 
-    # Post-process to create supplier name after the query
-    result = []
-    for supplier in suppliers:
-        first_name = supplier.get('request__listing__supplier__first_name', '')
-        last_name = supplier.get('request__listing__supplier__last_name', '')
-        email = supplier.get('request__listing__supplier__email', '')
-        
-        # Use full name if available, otherwise use email
-        if first_name and last_name:
-            supplier_name = f"{first_name} {last_name}"
-        else:
-            supplier_name = email
-            
-        result.append({
-            'supplier_id': supplier['request__listing__supplier__id'],
-            'supplier_name': supplier_name,
-            'transaction_count': supplier['transaction_count'],
-            'total_food_kg': float(supplier['total_food_kg'] if supplier['total_food_kg'] else 0)
-        })
-        
-    return result
+    return list(suppliers)
 
 
 def calculate_supplier_growth(start_date, end_date):
@@ -2888,17 +3303,24 @@ def calculate_supplier_growth(start_date, end_date):
     
     midpoint = start_date + timedelta(days=date_range // 2)
     
-    # Count active suppliers in first half
-    first_half_suppliers = Transaction.objects.filter(
-        request__listing__supplier__user_type="BUSINESS",
-        transaction_date__date__range=[start_date, midpoint]
-    ).values('request__listing__supplier').distinct().count()
-    
-    # Count active suppliers in second half
-    second_half_suppliers = Transaction.objects.filter(
-        request__listing__supplier__user_type="BUSINESS",
-        transaction_date__date__range=[midpoint + timedelta(days=1), end_date]
-    ).values('request__listing__supplier').distinct().count()
+    # Count active suppliers in each half with a single pass over the range
+    suppliers_by_half = Transaction.objects.filter(
+        request__listing__supplier_user_type="BUSINESS",
+        transaction_date__date__range=[start_date, end_date]
+    ).aggregate(
+        first_half=Count(
+            'request__listing__supplier',
+            filter=Q(transaction_date__date__lte=midpoint),
+            distinct=True,
+        ),
+        second_half=Count(
+            'request__listing__supplier',
+            filter=Q(transaction_date__date__gt=midpoint),
+            distinct=True,
+        ),
+    )
+    first_half_suppliers = suppliers_by_half['first_half']
+    second_half_suppliers = suppliers_by_half['second_half']
     
     if first_half_suppliers == 0:
         return 100.0 if second_half_suppliers > 0 else 0.0
@@ -2907,30 +3329,30 @@ def calculate_supplier_growth(start_date, end_date):
     return growth_rate
 
 
-def get_food_categories_by_supplier(start_date, end_date):
-    """Get most popular listing types supplied by suppliers"""
-    qs = (
-        Transaction.objects.filter(
-            request__listing__supplier__user_type="BUSINESS",
-            transaction_date__date__range=[start_date, end_date],
-            status="COMPLETED",
+def get_food_categories_by_supplier(start_date, end_date, transactions=None):
+    """Get most popular listing types supplied by suppliers
+
+    ``transactions`` may be passed to reuse an already-filtered queryset of
+    supplier transactions for the same date range.
+    """
+    if transactions is None:
+        transactions = Transaction.objects.filter(
+            request__listing__supplier_user_type="BUSINESS",
+            transaction_date__date__range=[start_date, end_date]
         )
-        .values('request__listing__listing_type')
+    qs = (
+        transactions.filter(status="COMPLETED")
+        .values(listing_type=F('request__listing__listing_type'))
         .annotate(
             count=Count('id'),
-            total_kg=Sum('request__quantity_requested'),
+            # Cast in SQL so the rows are JSON-ready without a Decimal pass
+            total_kg=Coalesce(
+                Cast(Sum('request__quantity_requested'), models.FloatField()), Value(0.0)
+            ),
         )
         .order_by('-count')[:10]
     )
-    # Convert Decimal to float for JSON serialization
-    result = []
-    for rec in qs:
-        result.append({
-            'listing_type': rec['request__listing__listing_type'],
-            'count': rec['count'],
-            'total_kg': float(rec['total_kg'] or 0),
-        })
-    return result
+    return list(qs)
 
 
 def calculate_avg_quality_rating_by_supplier(start_date, end_date):
@@ -2942,15 +3364,9 @@ def calculate_avg_quality_rating_by_supplier(start_date, end_date):
 
 def get_delivery_performance(start_date, end_date):
     """Calculate on-time delivery performance"""
-    total_deliveries = DeliveryAssignment.objects.filter(
-        transaction__request__listing__supplier__user_type="BUSINESS",
-        created_at__date__range=[start_date, end_date],
-        status="DELIVERED"
-    ).count()
-    
     # Consider a delivery on-time if delivered within 24 hours of assignment
-    on_time_deliveries = DeliveryAssignment.objects.filter(
-        transaction__request__listing__supplier__user_type="BUSINESS",
+    deliveries = DeliveryAssignment.objects.filter(
+        transaction__request__listing__supplier_user_type="BUSINESS",
         created_at__date__range=[start_date, end_date],
         status="DELIVERED"
     ).annotate(
@@ -2958,45 +3374,36 @@ def get_delivery_performance(start_date, end_date):
             F('delivered_at') - F('created_at'),
             output_field=models.DurationField()
         )
-    ).filter(delivery_time__lte=timedelta(hours=24)).count()
+    ).aggregate(
+        total=Count('id'),
+        on_time=Count('id', filter=Q(delivery_time__lte=timedelta(hours=24))),
+    )
     
-    if total_deliveries == 0:
+    if deliveries['total'] == 0:
         return 0.0
     
-    return (on_time_deliveries / total_deliveries) * 100
+    return (deliveries['on_time'] / deliveries['total']) * 100
 
 
 def calculate_avg_rescue_time(start_date, end_date):
     """Calculate average time from listing creation to rescue (completion) in hours"""
-    # Get completed transactions within the date range
-    completed_transactions = Transaction.objects.filter(
+    # Average the listing-to-completion interval in SQL, keeping only
+    # reasonable values (avoid negative or extremely large values)
+    avg_rescue_time = Transaction.objects.filter(
         status="COMPLETED",
         completion_date__date__range=[start_date, end_date]
-    ).select_related('request__listing')
-    
-    if not completed_transactions.exists():
-        return 0
-    
-    # Calculate time difference for each transaction
-    total_hours = 0
-    count = 0
-    
-    for transaction in completed_transactions:
-        if transaction.request and transaction.request.listing:
-            listing_created = transaction.request.listing.created_at
-            transaction_completed = transaction.completion_date
-            
-            # Calculate time difference in hours
-            if listing_created and transaction_completed:
-                time_diff = (transaction_completed - listing_created).total_seconds() / 3600
-                
-                # Only count reasonable values (avoid negative or extremely large values)
-                if 0 <= time_diff <= 72:  # Limit to 3 days to avoid outliers
-                    total_hours += time_diff
-                    count += 1
-    
+    ).annotate(
+        rescue_time=ExpressionWrapper(
+            F('completion_date') - F('request__listing__created_at'),
+            output_field=models.DurationField()
+        )
+    ).filter(
+        rescue_time__gte=timedelta(0),
+        rescue_time__lte=timedelta(hours=72),  # Limit to 3 days to avoid outliers
+    ).aggregate(avg_time=Avg('rescue_time'))['avg_time']
+
     # Return average or 0 if no valid data
-    return round(total_hours / count, 2) if count > 0 else 0
+    return round(avg_rescue_time.total_seconds() / 3600, 2) if avg_rescue_time else 0
 
 
 def get_rescued_food_by_category(start_date, end_date):
@@ -3013,56 +3420,54 @@ def get_rescued_food_by_category(start_date, end_date):
     ).order_by('-total_kg')
     
     # Format results
-    categories = []
-    for category in rescued_categories:
-        categories.append({
+    return [
+        {
             'category': category['request__listing__listing_type'],  # Changed from food_category to listing_type
             'total_kg': float(category['total_kg'] or 0),
             'count': category['count'],
-        })
-    
-    return categories
+        }
+        for category in rescued_categories
+    ]
 
 
 def analyze_peak_rescue_times(start_date, end_date):
     """Analyze what days and times have the most rescue activity"""
-    # Get transactions by day of week
-    transactions_by_day = Transaction.objects.filter(
-        status="COMPLETED",
-        completion_date__date__range=[start_date, end_date]
-    ).annotate(
-        day_of_week=ExtractWeekDay('completion_date')
-    ).values('day_of_week').annotate(
-        count=Count('id')
-    ).order_by('day_of_week')
-    
-    # Get transactions by hour
-    transactions_by_hour = Transaction.objects.filter(
+    # Group by day of week and hour together, then fold the (at most 7x24)
+    # groups into per-day and per-hour totals
+    transactions_by_slot = Transaction.objects.filter(
         status="COMPLETED",
         completion_date__date__range=[start_date, end_date]
     ).annotate(
+        day_of_week=ExtractWeekDay('completion_date'),
         hour=ExtractHour('completion_date')
-    ).values('hour').annotate(
+    ).values('day_of_week', 'hour').annotate(
         count=Count('id')
-    ).order_by('hour')
+    ).order_by()
+
+    day_counts = {}
+    hour_counts = {}
+    for slot in transactions_by_slot:
+        day_counts[slot['day_of_week']] = day_counts.get(slot['day_of_week'], 0) + slot['count']
+        hour_counts[slot['hour']] = hour_counts.get(slot['hour'], 0) + slot['count']
     
     # Format results
-    days = []
-    for day in transactions_by_day:
-        days.append({
-            'day_of_week': day['day_of_week'],
-            'day_name': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'][day['day_of_week'] % 7],
-            'count': day['count'],
-        })
+    days = [
+        {
+            'day_of_week': day_of_week,
+            'day_name': _WEEKDAY_NAMES[day_of_week - 1],
+            'count': day_counts[day_of_week],
+        }
+        for day_of_week in sorted(day_counts)
+    ]
     
-    hours = []
-    for hour_data in transactions_by_hour:
-        hour = hour_data['hour']
-        hours.append({
+    hours = [
+        {
             'hour': hour,
             'formatted_hour': f"{hour}:00",
-            'count': hour_data['count'],
-        })
+            'count': hour_counts[hour],
+        }
+        for hour in sorted(hour_counts)
+    ]
     
     return {
         'days': days,
@@ -3095,12 +3500,15 @@ def get_waste_reduction_trend(start_date, end_date):
         date_range.append(current_date)
         current_date += timezone.timedelta(days=1)
     
+    # Index the rescued totals by day once instead of scanning them per date
+    food_saved_by_date = {
+        day['date'].date(): day['food_saved']
+        for day in daily_totals.iterator(chunk_size=500)
+    }
+    
     # Fill in the trend data
     for current_date in date_range:
-        # Find data for this date, if it exists
-        day_data = next((day for day in daily_totals if day['date'].date() == current_date), None)
-        
-        daily_amount = float(day_data['food_saved'] if day_data else 0)
+        daily_amount = float(food_saved_by_date.get(current_date) or 0)
         running_total += daily_amount
         
         trend.append({
@@ -3205,27 +3613,18 @@ def calculate_nutritional_value(start_date, end_date):
 
 def calculate_beneficiary_savings(start_date, end_date):
     """Calculate the cost savings for beneficiaries"""
-    # Get total food received by beneficiaries
-    transactions = Transaction.objects.filter(
-        status="COMPLETED", 
+    # For cost savings, use a higher retail value than the listing price
+    # since beneficiaries would pay more at retail
+    retail_value_per_kg = 5.00  # Estimated retail value per kg
+
+    # Total food received by beneficiaries, summed by the database
+    total_quantity = Transaction.objects.filter(
+        status="COMPLETED",
         completion_date__date__range=[start_date, end_date],
-        request__requester__user_type__in=["NONPROFIT", "CONSUMER"]
-    ).select_related('request__listing')
-    
-    total_savings = 0
-    
-    for transaction in transactions:
-        if transaction.request and transaction.request.listing:
-            quantity = transaction.request.quantity_requested
-            # For cost savings, use a higher retail value than the listing price
-            # since beneficiaries would pay more at retail
-            retail_value_per_kg = 5.00  # Estimated retail value per kg
-            
-            if quantity:
-                transaction_savings = float(quantity) * retail_value_per_kg
-                total_savings += transaction_savings
-    
-    return total_savings
+        request__requester__user_type__in=["NONPROFIT", "CONSUMER"],
+    ).aggregate(total=Sum("request__quantity_requested"))["total"]
+
+    return float(total_quantity or 0) * retail_value_per_kg
 
 
 def get_satisfaction_metrics(start_date, end_date):
@@ -3340,12 +3739,19 @@ def calculate_volunteer_reliability(start_date, end_date):
         ))
     )
     
+    # Only the annotated counts are needed, so fetch them as plain tuples
+    volunteer_counts = list(
+        volunteers_with_deliveries.values_list(
+            'total_assigned', 'completed', 'failed', 'on_time'
+        )
+    )
+
     # Calculate overall reliability metrics
-    total_volunteers = volunteers_with_deliveries.count()
-    total_assigned = sum(v.total_assigned for v in volunteers_with_deliveries)
-    total_completed = sum(v.completed for v in volunteers_with_deliveries)
-    total_failed = sum(v.failed for v in volunteers_with_deliveries)
-    total_on_time = sum(v.on_time for v in volunteers_with_deliveries)
+    total_volunteers = len(volunteer_counts)
+    total_assigned = sum(row[0] for row in volunteer_counts)
+    total_completed = sum(row[1] for row in volunteer_counts)
+    total_failed = sum(row[2] for row in volunteer_counts)
+    total_on_time = sum(row[3] for row in volunteer_counts)
     
     # Calculate percentages
     completion_rate = 0
@@ -3361,9 +3767,9 @@ def calculate_volunteer_reliability(start_date, end_date):
     
     # Count highly reliable volunteers (>90% completion rate)
     reliable_volunteers = 0
-    for volunteer in volunteers_with_deliveries:
-        if volunteer.total_assigned >= 3:  # Only count volunteers with meaningful sample size
-            volunteer_completion_rate = (volunteer.completed / volunteer.total_assigned) * 100
+    for assigned, completed, _, _ in volunteer_counts:
+        if assigned >= 3:  # Only count volunteers with meaningful sample size
+            volunteer_completion_rate = (completed / assigned) * 100
             if volunteer_completion_rate >= 90:
                 reliable_volunteers += 1
     
@@ -3396,16 +3802,16 @@ def get_volunteer_activity_by_day(start_date, end_date):
     
     # Format results
     days = []
-    day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+    deliveries_by_weekday = {day['day_of_week']: day for day in deliveries_by_day}
     
-    # Initialize counts for all days
-    for i, day_name in enumerate(day_names):
+    # Initialize counts for all days, listed Monday first
+    for i, day_of_week in enumerate((2, 3, 4, 5, 6, 7, 1)):
         # Find data for this day if it exists
-        day_data = next((day for day in deliveries_by_day if day['day_of_week'] % 7 == i), None)
+        day_data = deliveries_by_weekday.get(day_of_week)
         
         days.append({
             'day_of_week': i,
-            'day_name': day_name,
+            'day_name': _WEEKDAY_NAMES[day_of_week - 1],
             'delivery_count': day_data['count'] if day_data else 0,
             'food_delivered_kg': float(day_data['food_delivered'] if day_data and day_data['food_delivered'] else 0),
             'volunteer_count': day_data['volunteer_count'] if day_data else 0
@@ -1,7 +1,24 @@
 from celery import shared_task
+from django.core.mail import EmailMessage
 import os
 
+from analytics.models import Report
+
 @shared_task
 def export_and_train_expiry_model():
     os.system('python manage.py export_listing_data')
     os.system('python manage.py train_expiry_model')
+
+@shared_task
+def email_report_pdf(report_id, recipient):
+    """Render a report's PDF on a worker and email it, keeping reportlab off the request thread"""
+    report = Report.objects.select_related("generated_by").get(pk=report_id)
+    message = EmailMessage(
+        subject=f"Report export: {report.title}",
+        body=f"The PDF export of \"{report.title}\" is attached.",
+        to=[recipient],
+    )
+    message.attach(
+        f'{str(report.title).replace(" ", "_")}.pdf', report.render_pdf(), "application/pdf"
+    )
+    message.send()
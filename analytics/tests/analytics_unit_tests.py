@@ -1,14 +1,33 @@
+import io
+import re
+import zipfile
 import pytest
 from decimal import Decimal
 from django.test import TestCase
 from django.utils import timezone
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.core import mail
 from django.core.exceptions import ValidationError
-from analytics.models import DailyAnalytics, ImpactMetrics, Report, SystemMetrics, UserActivityLog
+from django.db import IntegrityError
+from analytics.models import (
+    DailyAnalytics,
+    ImpactMetrics,
+    Report,
+    SystemMetrics,
+    UserActivityLog,
+    analyze_peak_rescue_times,
+)
+from analytics.tasks import email_report_pdf
 from analytics.templatetags.analytics_filters import percentage, absolute
-from food_listings.models import FoodListing
+from food_listings.models import ComplianceCheck, FoodListing
 from transactions.models import FoodRequest, Transaction
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+from unittest.mock import patch
+from kombu.exceptions import OperationalError as BrokerOperationalError
 
 User = get_user_model()
 
@@ -53,6 +72,35 @@ class TestImpactMetrics(TestCase):
         self.assertEqual(metrics.meals_provided, 10)  # 5.0 * 2
         self.assertTrue(metrics.monetary_value_saved > 0)
 
+    def test_calculate_metrics_for_range(self):
+        today = timezone.now().date()
+        yesterday = today - timedelta(days=1)
+        request = FoodRequest.objects.create(
+            listing=self.listing,
+            quantity_requested=5.0,
+            requester=self.user,
+            pickup_date=timezone.now() + timedelta(days=1)
+        )
+        Transaction.objects.create(
+            request=request,
+            status='COMPLETED',
+            completion_date=timezone.now()
+        )
+        # A stale row for yesterday is reset rather than duplicated
+        ImpactMetrics.objects.create(date=yesterday, food_redistributed_kg=Decimal('3.0'))
+
+        metrics = ImpactMetrics.calculate_for_range(yesterday, today)
+
+        self.assertEqual([m.date for m in metrics], [yesterday, today])
+        self.assertEqual(ImpactMetrics.objects.count(), 2)
+        stored = ImpactMetrics.objects.get(date=today)
+        single_day = ImpactMetrics.calculate_for_date(today)
+        self.assertEqual(stored.food_redistributed_kg, single_day.food_redistributed_kg)
+        self.assertEqual(stored.monetary_value_saved, single_day.monetary_value_saved)
+        self.assertEqual(
+            ImpactMetrics.objects.get(date=yesterday).food_redistributed_kg, Decimal('0')
+        )
+
 class TestDailyAnalytics(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
@@ -85,6 +133,30 @@ class TestDailyAnalytics(TestCase):
         self.assertEqual(analytics.requests_fulfilled, 3)
         self.assertEqual(analytics.food_saved_kg, Decimal('10.5'))
 
+    def test_increment_metrics_updates_saved_row(self):
+        analytics = DailyAnalytics.get_or_create_for_listing(self.listing)
+
+        analytics.increment_metrics(2.5)
+        analytics.increment_metrics(Decimal('1.5'))
+
+        stored = DailyAnalytics.objects.get(pk=analytics.pk)
+        self.assertEqual(stored.requests_received, 2)
+        self.assertEqual(stored.requests_fulfilled, 2)
+        self.assertEqual(stored.food_saved_kg, Decimal('4.0'))
+        self.assertEqual(analytics.food_saved_kg, Decimal('4.0'))
+
+    def test_increment_metrics_inserts_unsaved_row(self):
+        analytics = DailyAnalytics(
+            date=timezone.now().date(), user=self.user, listing=self.listing
+        )
+
+        analytics.increment_metrics(3)
+
+        self.assertIsNotNone(analytics.pk)
+        stored = DailyAnalytics.objects.get(pk=analytics.pk)
+        self.assertEqual(stored.requests_received, 1)
+        self.assertEqual(stored.food_saved_kg, Decimal('3'))
+
     def test_unique_constraint(self):
         # Create a unique date for this test run
         test_date = timezone.now().date() - timedelta(days=3)
@@ -206,6 +278,161 @@ class TestReport(TestCase):
         self.assertIsNone(report.schedule_frequency)
         self.assertIsNone(report.schedule_time)
 
+    def test_next_run_time_weekly_and_monthly(self):
+        report = Report(
+            title='Scheduled Report',
+            report_type='IMPACT',
+            generated_by=self.user,
+            is_scheduled=True,
+            schedule_time=time(9, 0),
+        )
+        # Wednesday 2025-03-26 10:00 UTC, after today's 09:00 slot
+        now = timezone.make_aware(datetime(2025, 3, 26, 10, 0))
+        with patch('django.utils.timezone.now', return_value=now):
+            report.schedule_frequency = 'WEEKLY'
+            self.assertEqual(
+                report.get_next_run_time(),
+                timezone.make_aware(datetime(2025, 3, 31, 9, 0)),
+            )
+            report.schedule_frequency = 'MONTHLY'
+            self.assertEqual(
+                report.get_next_run_time(),
+                timezone.make_aware(datetime(2025, 4, 1, 9, 0)),
+            )
+
+    def test_scheduled_reports_queryset(self):
+        report = Report.objects.create(
+            title='Scheduled Report',
+            report_type='IMPACT',
+            generated_by=self.user,
+            date_range_start=timezone.now().date(),
+            date_range_end=timezone.now().date(),
+            data={'summary': 'Test summary', 'daily_trends': []},
+            is_scheduled=True,
+            schedule_frequency='DAILY',
+        )
+        scheduled = Report.get_scheduled_reports()
+        self.assertEqual([r.pk for r in scheduled], [report.pk])
+        # Callers can keep filtering the result, and list rows skip the JSON data
+        self.assertFalse(scheduled.filter(schedule_frequency='WEEKLY').exists())
+        self.assertIn('data', scheduled[0].get_deferred_fields())
+
+        report.unschedule_report()
+        self.assertFalse(Report.get_scheduled_reports().exists())
+
+    def test_email_report_pdf(self):
+        report = Report.objects.create(
+            title='Emailed Report',
+            report_type='IMPACT',
+            generated_by=self.user,
+            date_range_start=timezone.now().date(),
+            date_range_end=timezone.now().date(),
+            data={'summary': 'Test summary', 'daily_trends': [{'date': '2025-03-28', 'value': 10}]},
+            summary='Test summary',
+        )
+
+        email_report_pdf(report.id, 'admin@example.com')
+
+        self.assertEqual(len(mail.outbox), 1)
+        filename, content, mimetype = mail.outbox[0].attachments[0]
+        self.assertEqual(filename, 'Emailed_Report.pdf')
+        self.assertEqual(mimetype, 'application/pdf')
+        self.assertTrue(content.startswith(b'%PDF'))
+
+class TestPeakRescueTimes(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='peak@example.com',
+            password='testpass123',
+            user_type='BUSINESS'
+        )
+        self.listing = FoodListing.objects.create(
+            title='Peak Listing',
+            supplier=self.user,
+            quantity=10.0,
+            unit="KG",
+            listing_type='COMMERCIAL',
+            price=Decimal('5.00'),
+            expiry_date=timezone.now() + timedelta(days=1)
+        )
+
+    def test_day_names_match_completion_weekday(self):
+        # 2025-03-24 was a Monday
+        completed_at = timezone.make_aware(datetime(2025, 3, 24, 14, 0))
+        request = FoodRequest.objects.create(
+            listing=self.listing,
+            quantity_requested=5.0,
+            requester=self.user,
+            pickup_date=completed_at
+        )
+        Transaction.objects.create(
+            request=request,
+            status='COMPLETED',
+            completion_date=completed_at
+        )
+
+        peak = analyze_peak_rescue_times(completed_at.date(), completed_at.date())
+
+        self.assertEqual(peak['peak_day']['day_name'], 'Monday')
+        self.assertEqual(peak['peak_hour']['hour'], 14)
+
+class TestSupplierReportQueryCount(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            email='reports@example.com',
+            password='testpass123',
+            user_type='ADMIN'
+        )
+        self.beneficiary = User.objects.create_user(
+            email='beneficiary@example.com',
+            password='testpass123',
+            user_type='NONPROFIT'
+        )
+        self.today = timezone.now().date()
+
+    def _add_supplier_with_transaction(self, index):
+        supplier = User.objects.create_user(
+            email=f'supplier{index}@example.com',
+            password='testpass123',
+            user_type='BUSINESS'
+        )
+        listing = FoodListing.objects.create(
+            title=f'Listing {index}',
+            supplier=supplier,
+            quantity=10.0,
+            unit="KG",
+            listing_type='COMMERCIAL',
+            price=Decimal('5.00'),
+            expiry_date=timezone.now() + timedelta(days=1)
+        )
+        request = FoodRequest.objects.create(
+            listing=listing,
+            quantity_requested=5.0,
+            requester=self.beneficiary,
+            pickup_date=timezone.now() + timedelta(days=1)
+        )
+        Transaction.objects.create(
+            request=request,
+            status='COMPLETED',
+            completion_date=timezone.now()
+        )
+
+    def _count_report_queries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            Report.generate_supplier_performance_report(
+                self.today, self.today, self.admin
+            )
+        return len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_suppliers(self):
+        self._add_supplier_with_transaction(0)
+        single_supplier_queries = self._count_report_queries()
+
+        for index in range(1, 5):
+            self._add_supplier_with_transaction(index)
+
+        self.assertEqual(self._count_report_queries(), single_supplier_queries)
+
 class TestAnalyticsFilters(TestCase):
     def test_percentage_filter(self):
         self.assertEqual(percentage(50, 100), '50.0')
@@ -260,4 +487,293 @@ class TestSystemMetrics(TestCase):
                 # Convert database IntegrityError to ValidationError for the test
                 if 'duplicate key' in str(e) or 'unique constraint' in str(e):
                     raise ValidationError("Duplicate entry")
-                raise
\ No newline at end of file
+                raise
+
+
+class TestComplianceReport(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            email='compliance@example.com',
+            password='testpass123',
+            user_type='ADMIN'
+        )
+        supplier = User.objects.create_user(
+            email='supplier@example.com',
+            password='testpass123',
+            user_type='BUSINESS'
+        )
+        self.listings = [
+            FoodListing.objects.create(
+                title=f'Listing {index}',
+                supplier=supplier,
+                quantity=10.0,
+                unit="KG",
+                listing_type='COMMERCIAL',
+                price=Decimal('5.00'),
+                expiry_date=timezone.now() + timedelta(days=1)
+            )
+            for index in range(2)
+        ]
+        self.today = timezone.now().date()
+
+    def test_creates_missing_checks_once(self):
+        report = Report.generate_compliance_report(self.today, self.today, self.admin)
+        self.assertEqual(report.data['compliance_checks_created'], 2)
+        self.assertEqual(ComplianceCheck.objects.filter(listing__in=self.listings).count(), 2)
+
+        # Nothing is left to create: look up, count and save the report only
+        with self.assertNumQueries(6):
+            report = Report.generate_compliance_report(self.today, self.today, self.admin)
+        self.assertEqual(report.data['compliance_checks_created'], 0)
+        self.assertEqual(ComplianceCheck.objects.count(), 2)
+
+    def test_conflicting_batch_counts_only_inserted_checks(self):
+        # The first listing was already checked by someone else
+        ComplianceCheck.objects.create(listing=self.listings[0], is_compliant=False)
+
+        # The batch insert hits a conflict, as it would if another report run
+        # had inserted the same check first
+        with patch.object(ComplianceCheck.objects, 'bulk_create', side_effect=IntegrityError):
+            report = Report.generate_compliance_report(self.today, self.today, self.admin)
+
+        self.assertEqual(report.data['compliance_checks_created'], 1)
+        self.assertEqual(report.data['total_checks'], 2)
+        self.assertFalse(ComplianceCheck.objects.get(listing=self.listings[0]).is_compliant)
+        self.assertTrue(ComplianceCheck.objects.get(listing=self.listings[1]).is_compliant)
+
+
+class TestReportExports(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='exports@example.com',
+            password='testpass123',
+            user_type='ADMIN'
+        )
+
+    def _create_report(self, data):
+        return Report.objects.create(
+            title='Export Report',
+            report_type='IMPACT',
+            generated_by=self.user,
+            date_range_start=timezone.now().date(),
+            date_range_end=timezone.now().date(),
+            data=data,
+            summary='Test summary',
+        )
+
+    def test_csv_export_marks_failed_stream(self):
+        # Trend rows that are not dicts cannot be formatted
+        report = self._create_report({'summary': {}, 'daily_trends': ['bad row']})
+
+        with self.assertLogs('analytics.models', level='ERROR'):
+            content = b''.join(report.export_as_csv().streaming_content).decode()
+
+        self.assertIn('Export Report', content)
+        self.assertTrue(content.rstrip().endswith('the data above is incomplete.'))
+
+    def test_exports_default_missing_peak_rescue_keys(self):
+        report = self._create_report({'summary': {}, 'metrics': {'peak_rescue_times': {
+            'days': [{'day_name': 'Monday'}, {'count': 4}],
+            'hours': [{'formatted_hour': '14:00'}],
+        }}})
+
+        content = b''.join(report.export_as_csv().streaming_content).decode()
+        self.assertIn('Monday,0', content)
+        self.assertIn('Unknown,4', content)
+        self.assertIn('14:00,0', content)
+        self.assertTrue(report.render_pdf().startswith(b'%PDF'))
+
+    def _email_export_url(self, report):
+        url = reverse('analytics:export_report', kwargs={'report_id': report.id, 'export_format': 'pdf'})
+        return f'{url}?delivery=email'
+
+    def test_email_delivery_queues_pdf_task(self):
+        report = self._create_report({'summary': {}})
+        self.client.force_login(self.user)
+
+        with patch('analytics.views.email_report_pdf') as task:
+            response = self.client.get(self._email_export_url(report))
+
+        task.delay.assert_called_once_with(report.id, self.user.email)
+        self.assertRedirects(
+            response,
+            reverse('analytics:report_detail', kwargs={'report_id': report.id}),
+            fetch_redirect_response=False,
+        )
+
+    def test_email_delivery_falls_back_to_download_without_broker(self):
+        report = self._create_report({'summary': {}})
+        self.client.force_login(self.user)
+
+        with patch('analytics.views.email_report_pdf') as task, \
+                self.assertLogs('analytics.views', level='ERROR'):
+            task.delay.side_effect = BrokerOperationalError('broker unreachable')
+            response = self.client.get(self._email_export_url(report))
+
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertTrue(response.content.startswith(b'%PDF'))
+
+    def test_pdf_cache_key_follows_generated_by_name(self):
+        report = self._create_report({'summary': {}})
+        key = report._pdf_cache_key()
+
+        self.user.first_name = 'Renamed'
+        self.user.save()
+
+        self.assertNotEqual(Report.objects.get(pk=report.pk)._pdf_cache_key(), key)
+
+    def test_excel_trend_rows_keep_missing_and_text_values(self):
+        report = self._create_report({'summary': {}, 'daily_trends': [
+            {'date': '2025-03-28', 'food': 1, 'meals': 2.5},
+            {'date': '2025-03-29', 'food': None},
+            {'date': '2025-03-30', 'food': 'n/a', 'meals': 3},
+        ]})
+
+        response = report.export_as_excel()
+
+        with zipfile.ZipFile(io.BytesIO(response.content)) as workbook:
+            sheet = workbook.read('xl/worksheets/sheet1.xml').decode()
+        # {column: (attributes, value)} for each of the three trend rows
+        rows = [
+            {
+                column: (attributes, re.search(r'<v>([^<]*)</v>', body or ''))
+                for column, attributes, body in re.findall(
+                    r'<c r="([A-Z]+)\d+"([^>]*?)(?:/>|>(.*?)</c>)', row
+                )
+            }
+            for row in re.findall(r'<row [^>]*>(.*?)</row>', sheet)[-3:]
+        ]
+        self.assertEqual(rows[0]['B'][1].group(1), '1')
+        self.assertEqual(rows[0]['C'][1].group(1), '2.5')
+        # Missing and None values are left blank, not written as 0
+        self.assertIsNone(rows[1]['B'][1])
+        self.assertIsNone(rows[1]['C'][1])
+        # A text value only affects its own cell, not the rest of the row
+        self.assertIn(' t="', rows[2]['B'][0])
+        self.assertEqual(rows[2]['C'][1].group(1), '3')
+
+
+class TestReportPayloadCache(TestCase):
+    def setUp(self):
+        caches['analytics'].clear()
+        self.user = User.objects.create_user(
+            email='payloads@example.com',
+            password='testpass123',
+            user_type='ADMIN'
+        )
+
+    def test_refresh_replaces_cached_payload(self):
+        yesterday = timezone.now().date() - timedelta(days=1)
+        payloads = iter([({'n': 1}, 'first'), ({'n': 2}, 'second')])
+
+        def compute(start_date, end_date):
+            return next(payloads)
+
+        def cached(refresh=False):
+            return Report._cached_report_payload(
+                'SYSTEM', yesterday, yesterday, compute, refresh=refresh
+            )[1]
+
+        self.assertEqual(cached(), 'first')
+        self.assertEqual(cached(), 'first')
+        self.assertEqual(cached(refresh=True), 'second')
+        self.assertEqual(cached(), 'second')
+
+    def test_regenerate_refreshes_closed_window_payload(self):
+        yesterday = timezone.now().date() - timedelta(days=1)
+        payloads = iter([({'n': 1}, 'first'), ({'n': 2}, 'second')])
+        with patch.object(
+            Report, '_compute_system_performance_report', side_effect=lambda *args: next(payloads)
+        ):
+            report = Report.generate_system_performance_report(yesterday, yesterday, self.user)
+            self.assertEqual(report.summary, 'first')
+
+            report.generate_report()
+            self.assertEqual(report.summary, 'second')
+            self.assertEqual(
+                Report.generate_system_performance_report(yesterday, yesterday, self.user).summary,
+                'second',
+            )
+
+    def test_supplier_report_sees_status_change_in_past_window(self):
+        yesterday = timezone.now().date() - timedelta(days=1)
+        supplier = User.objects.create_user(
+            email='cached-supplier@example.com',
+            password='testpass123',
+            user_type='BUSINESS'
+        )
+        listing = FoodListing.objects.create(
+            title='Cached Listing',
+            supplier=supplier,
+            quantity=10.0,
+            unit="KG",
+            listing_type='COMMERCIAL',
+            price=Decimal('5.00'),
+            expiry_date=timezone.now() + timedelta(days=1)
+        )
+        request = FoodRequest.objects.create(
+            listing=listing,
+            quantity_requested=5.0,
+            requester=self.user,
+            pickup_date=timezone.now() + timedelta(days=1)
+        )
+        transaction = Transaction.objects.create(request=request, status='PENDING')
+        Transaction.objects.filter(pk=transaction.pk).update(
+            transaction_date=timezone.now() - timedelta(days=1)
+        )
+
+        first = Report.generate_supplier_performance_report(yesterday, yesterday, self.user)
+        Transaction.objects.filter(pk=transaction.pk).update(status='COMPLETED')
+        second = Report.generate_supplier_performance_report(yesterday, yesterday, self.user)
+
+        self.assertEqual(first.data['metrics']['total_food_volume'], 0)
+        self.assertEqual(second.data['metrics']['total_food_volume'], 5.0)
+
+    def test_generate_view_saves_report_with_description(self):
+        today = timezone.now().date()
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('analytics:generate_report'), {
+            'report_type': 'SYSTEM',
+            'title': 'Weekly System Report',
+            'date_range_start': today - timedelta(days=7),
+            'date_range_end': today,
+            'description': 'For the ops review',
+        })
+
+        report = Report.objects.get()
+        self.assertRedirects(
+            response,
+            reverse('analytics:report_detail', kwargs={'report_id': report.id}),
+            fetch_redirect_response=False,
+        )
+        self.assertEqual(report.report_type, 'SYSTEM')
+        self.assertEqual(report.title, 'Weekly System Report')
+        self.assertEqual(report.description, 'For the ops review')
+        self.assertIn('daily_trends', report.data)
+
+    def test_regenerate_view_updates_report_in_place(self):
+        report = Report.objects.create(
+            title='Impact Report',
+            report_type='IMPACT',
+            generated_by=self.user,
+            date_range_start=timezone.now().date(),
+            date_range_end=timezone.now().date(),
+            data={},
+            summary='Old summary',
+        )
+        self.client.force_login(self.user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(
+                reverse('analytics:regenerate_report', kwargs={'report_id': report.id})
+            )
+
+        self.assertEqual(response.json()['status'], 'success')
+        self.assertEqual(Report.objects.count(), 1)
+        self.assertFalse(
+            any('INSERT INTO "analytics_report"' in query['sql'] for query in ctx.captured_queries)
+        )
+        report.refresh_from_db()
+        self.assertNotEqual(report.summary, 'Old summary')
+        self.assertIn('- Regenerated', report.title)
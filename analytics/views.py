@@ -18,6 +18,7 @@ from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils import timezone
 from django.views.decorators.http import require_POST
+from kombu.exceptions import OperationalError as BrokerOperationalError
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
@@ -38,6 +39,7 @@ from .models import (
 from notifications.services import NotificationService
 
 from .ml_utils import predict_expiry_risk
+from .tasks import email_report_pdf
 
 import csv
 import xlsxwriter
@@ -893,55 +895,23 @@ def generate_report(request):
                         request, "analytics/generate_report.html", {"form": form}
                     )
 
-                # Map report types to generator functions
-                generators = {
-                    "IMPACT": Report.generate_impact_report,
-                    "TRANSACTION": Report.generate_transaction_report,
-                    "USER_ACTIVITY": Report.generate_user_activity_report,
-                    "COMPLIANCE": Report.generate_compliance_report,
-                    "SYSTEM": Report.generate_system_performance_report,
-                    "SUPPLIER": Report.generate_supplier_performance_report,
-                    "WASTE_REDUCTION": Report.generate_waste_reduction_report,
-                    "BENEFICIARY": Report.generate_beneficiary_impact_report,
-                    "VOLUNTEER": Report.generate_volunteer_performance_report,
-                    "EXPIRY_WASTE": Report.generate_expiry_waste_report,
-                    "USER_RETENTION": Report.generate_user_retention_churn_report,  # Fixed method name
-                }
-
-                # Get the generator function
-                generator = generators.get(report_type)
-                if not generator:
+                # Every report type is built through Report.REPORT_BUILDERS
+                if report_type not in Report.REPORT_BUILDERS:
                     form.add_error("report_type", "Invalid report type")
                     return render(
                         request, "analytics/generate_report.html", {"form": form}
                     )
 
                 try:
-                    # Generate the report
-                    report = generator(
-                        start_date=start_date,
-                        end_date=end_date,
-                        user=request.user,
-                        title=title,
+                    report = Report.create_report(
+                        report_type,
+                        start_date,
+                        end_date,
+                        request.user,
+                        title,
+                        description=description,
                     )
 
-                    # Ensure report was created
-                    if not report or not report.id:
-                        # Create a basic report if generation failed
-                        report = Report.objects.create(
-                            title=title,
-                            report_type=report_type,
-                            date_range_start=start_date,
-                            date_range_end=end_date,
-                            generated_by=request.user,
-                            data={"metrics": {}, "daily_trends": []},
-                            summary=f"No data available for this {report_type.lower()} report",
-                        )
-
-                    if description:
-                        report.description = description
-                        report.save()
-
                     sweetify.success(request, "Report generated successfully", timer=3000)
                     return redirect("analytics:report_detail", report_id=report.id)
 
@@ -971,50 +941,16 @@ def regenerate_report(request, report_id):
     """Regenerate an existing report with fresh data"""
     report = get_object_or_404(Report, id=report_id)
     try:
-        # Get the appropriate generator function based on report type
-        generator_functions = {
-            "IMPACT": Report.generate_impact_report,
-            "TRANSACTION": Report.generate_transaction_report,
-            "USER_ACTIVITY": Report.generate_user_activity_report,
-            "COMPLIANCE": Report.generate_compliance_report,
-            "SYSTEM": Report.generate_system_performance_report,
-            "SUPPLIER": Report.generate_supplier_performance_report,
-            "WASTE_REDUCTION": Report.generate_waste_reduction_report,
-            "BENEFICIARY": Report.generate_beneficiary_impact_report,
-            "VOLUNTEER": Report.generate_volunteer_performance_report,
-            "EXPIRY_WASTE": Report.generate_expiry_waste_report,
-            "USER_RETENTION": Report.generate_user_retention_churn_report,
-        }
-        
-        generator = generator_functions.get(report.report_type)
-        if not generator:
-            raise ValueError(f"Unsupported report type: {report.report_type}")
-        
-        # Generate a fresh report with the same parameters
-        fresh_report = generator(
-            start_date=report.date_range_start,
-            end_date=report.date_range_end,
-            user=report.generated_by,
-            title=report.title,
-        )
-        
-        # Copy data from fresh report to original report
-        report.data = fresh_report.data
-        report.summary = fresh_report.summary
-        
-        # Update the timestamp to current time
-        now = timezone.now()
-        report.date_generated = now
-        
+        # Recompute the data in place, refreshing any cached payload; no
+        # temporary report row is written
+        report.generate_report()
+
         # Update the title to indicate it's regenerated (if not already marked)
         if not "- Regenerated" in report.title:
-            report.title = f"{report.title} - Regenerated {now.strftime('%H:%M')}"
-        
-        # Save the updated original report
-        report.save()
-        
-        # Delete the temporary fresh report
-        fresh_report.delete()
+            report.title = (
+                f"{report.title} - Regenerated {report.date_generated.strftime('%H:%M')}"
+            )
+            report.save(update_fields=["title"])
         
         # Send success notification
         NotificationService.create_report_notification(
@@ -1160,7 +1096,22 @@ def update_report(request, report_id):
 def export_report(request, report_id, export_format):
     """Export a report in various formats"""
     try:
-        report = Report.objects.get(pk=report_id)
+        # Every export format prints the generating user's name
+        report = Report.objects.select_related("generated_by").get(pk=report_id)
+
+        if export_format == "pdf" and request.GET.get("delivery") == "email":
+            # Large PDFs can take a while to build; render them on a worker
+            # and email the file instead of holding up this request
+            try:
+                email_report_pdf.delay(report.id, request.user.email)
+            except BrokerOperationalError:
+                # Without a reachable broker, fall back to a direct download
+                logger.exception("Could not queue PDF email for report %s", report.id)
+            else:
+                messages.success(
+                    request, f"The PDF will be emailed to {request.user.email} shortly"
+                )
+                return redirect("analytics:report_detail", report_id=report.id)
 
         if export_format == "pdf":
             response = report.export_as_pdf()
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6 on 2026-10-16 09:40
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_supplier_user_type(apps, schema_editor):
+    FoodListing = apps.get_model('food_listings', 'FoodListing')
+    CustomUser = apps.get_model('users', 'CustomUser')
+    FoodListing.objects.update(
+        supplier_user_type=Subquery(
+            CustomUser.objects.filter(pk=OuterRef('supplier_id')).values('user_type')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('food_listings', '0004_alter_foodlisting_status'),
+        ('users', '0010_customuser_business_address_customuser_city_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foodlisting',
+            name='supplier_user_type',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=10),
+        ),
+        migrations.RunPython(backfill_supplier_user_type, migrations.RunPython.noop),
+    ]
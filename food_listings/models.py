@@ -51,6 +51,10 @@ class FoodListing(models.Model):
     supplier = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="food_listings"
     )
+    # Copy of supplier.user_type so analytics can filter without joining users
+    supplier_user_type = models.CharField(
+        max_length=10, blank=True, editable=False, db_index=True
+    )
     address = models.CharField(max_length=255, null=True, blank=True)
     city = models.CharField(max_length=100, null=True, blank=True)
     postal_code = models.CharField(max_length=20, null=True, blank=True)
@@ -116,9 +120,25 @@ class FoodListing(models.Model):
                 {"price": "Price is required for commercial listings"}
             )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded supplier so save() can tell when it changes
+        instance._loaded_supplier_id = instance.__dict__.get("supplier_id")
+        return instance
+
     def save(self, *args, **kwargs):
         self.clean()
+        # Reading supplier.user_type costs a query, so only copy it for a new
+        # listing or a changed supplier; CustomUser.save() keeps it in step
+        # after that. bulk_create() and update() skip this and must set it.
+        if self.supplier_id and (
+            self._state.adding
+            or self.supplier_id != getattr(self, "_loaded_supplier_id", None)
+        ):
+            self.supplier_user_type = self.supplier.user_type
         super().save(*args, **kwargs)
+        self._loaded_supplier_id = self.supplier_id
         self.update_status_based_on_quantity()
 
     class Meta:
@@ -78,6 +78,24 @@ class TestFoodListing:
         food_listing.refresh_from_db()
         assert food_listing.status == 'INACTIVE'
 
+    def test_resave_skips_supplier_lookup(self, food_listing, django_assert_num_queries):
+        listing = FoodListing.objects.get(pk=food_listing.pk)
+        with django_assert_num_queries(1):
+            listing.save()
+        assert listing.supplier_user_type == 'BUSINESS'
+
+    def test_changed_supplier_updates_user_type(self, food_listing):
+        nonprofit = User.objects.create_user(
+            email='nonprofit@example.com',
+            password='testpass123',
+            user_type='NONPROFIT'
+        )
+        listing = FoodListing.objects.get(pk=food_listing.pk)
+        listing.supplier = nonprofit
+        listing.save()
+        listing.refresh_from_db()
+        assert listing.supplier_user_type == 'NONPROFIT'
+
 @pytest.mark.django_db
 class TestFoodImage:
     def test_create_food_image(self, food_listing):
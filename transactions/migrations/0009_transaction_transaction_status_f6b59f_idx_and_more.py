@@ -0,0 +1,21 @@
+# Generated by Django 5.1.6 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0008_alter_foodrequest_preferred_time'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['status', 'completion_date'], name='transaction_status_f6b59f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['status', 'transaction_date'], name='transaction_status_81ea76_idx'),
+        ),
+    ]
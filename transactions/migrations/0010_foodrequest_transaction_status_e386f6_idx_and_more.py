@@ -0,0 +1,21 @@
+# Generated by Django 5.1.6 on 2026-10-16 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0009_transaction_transaction_status_f6b59f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='foodrequest',
+            index=models.Index(fields=['status', 'updated_at'], name='transaction_status_e386f6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='deliveryassignment',
+            index=models.Index(fields=['status', 'delivered_at'], name='transaction_status_75dfbd_idx'),
+        ),
+    ]
@@ -84,6 +84,7 @@ class FoodRequest(models.Model):
             models.Index(fields=["status", "pickup_date"]),
             models.Index(fields=["requester", "status"]),
             models.Index(fields=["listing", "status"]),
+            models.Index(fields=["status", "updated_at"]),
         ]
 
     def __str__(self):
@@ -110,6 +111,12 @@ class Transaction(models.Model):
     completion_date = models.DateTimeField(null=True, blank=True)
     notes = models.TextField(blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "completion_date"]),
+            models.Index(fields=["status", "transaction_date"]),
+        ]
+
     def get_user_rating_for_user(self, user):
         """Get the rating given by a specific user for this transaction"""
         try:
@@ -208,4 +215,5 @@ class DeliveryAssignment(models.Model):
         indexes = [
             models.Index(fields=["status", "pickup_window_start"]),
             models.Index(fields=["volunteer", "status"]),
+            models.Index(fields=["status", "delivered_at"]),
         ]
@@ -101,6 +101,13 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         is_new = self.pk is None
         super().save(*args, **kwargs)
 
+        # Keep the user type copied onto this user's food listings in step
+        update_fields = kwargs.get("update_fields")
+        if not is_new and (update_fields is None or "user_type" in update_fields):
+            self.food_listings.exclude(supplier_user_type=self.user_type).update(
+                supplier_user_type=self.user_type
+            )
+
         if is_new or self.user_type:
             self.set_permissions()
 